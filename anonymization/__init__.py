@@ -1,14 +1,30 @@
-from anonymization.core.anonymizer import Anonymizer
-from anonymization.core.column_handlers import (
-    BaseColumnHandler,
-    FirstNameHandler,
-    LastNameHandler,
-    FullNameHandler,
-    FullNameInvertedHandler,
-    EmailHandler,
-    IdHandler,
-    MiscHandler
-)
-from anonymization.utils.hasher import DeterministicHasher
-from anonymization.utils.normalizer import StringNormalizer, IdNormalizer
-from anonymization.utils.name_generator import NameGenerator
+from importlib import import_module
+from typing import Any
+
+
+_EXPORTS = {
+    'Anonymizer': 'anonymization.core.anonymizer',
+    'BaseColumnHandler': 'anonymization.core.column_handlers',
+    'FirstNameHandler': 'anonymization.core.column_handlers',
+    'LastNameHandler': 'anonymization.core.column_handlers',
+    'FullNameHandler': 'anonymization.core.column_handlers',
+    'FullNameInvertedHandler': 'anonymization.core.column_handlers',
+    'EmailHandler': 'anonymization.core.column_handlers',
+    'IdHandler': 'anonymization.core.column_handlers',
+    'MiscHandler': 'anonymization.core.column_handlers',
+    'DeterministicHasher': 'anonymization.utils.hasher',
+    'StringNormalizer': 'anonymization.utils.normalizer',
+    'IdNormalizer': 'anonymization.utils.normalizer',
+    'NameGenerator': 'anonymization.utils.name_generator'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'anonymization' has no attribute '{name}'")
+    
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from anonymization.utils.name_pool import NamePool
+
+
+COLUMN_NAMES = {
+    'first_name': 'FirstName',
+    'last_name': 'LastName',
+    'full_name': 'FullName',
+    'full_name_inverted': 'FullNameInverted',
+    'email': 'Email',
+    'id': 'EmployeeID',
+    'misc': 'Notes'
+}
+
+DEPARTMENTS = ['Engineering', 'Sales', 'Marketing', 'Finance', 'Support', 'Legal']
+
+DOMAINS = ['company.com', 'example.org', 'corp.net']
+
+
+class SyntheticDatasetGenerator:
+    
+    def __init__(self,
+                 rows: int,
+                 cardinality: int,
+                 locale: str = 'en_US',
+                 column_types: Optional[List[str]] = None,
+                 seed: int = 0):
+        self.rows = rows
+        self.cardinality = cardinality
+        self.locale = locale
+        self.column_types = column_types or list(COLUMN_NAMES)
+        self.seed = seed
+        
+        unknown = [column_type for column_type in self.column_types if column_type not in COLUMN_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown column types: {', '.join(unknown)}")
+    
+    def column_config(self) -> Dict[str, str]:
+        return {COLUMN_NAMES[column_type]: column_type for column_type in self.column_types}
+    
+    def _distinct_names(self, names: tuple, count: int) -> np.ndarray:
+        distinct = [
+            names[i % len(names)] if i < len(names) else f"{names[i % len(names)]}{i // len(names) + 1}"
+            for i in range(count)
+        ]
+        return np.array(distinct, dtype=object)
+    
+    def generate(self) -> pd.DataFrame:
+        rng = np.random.default_rng(self.seed)
+        pool = NamePool.for_locale(self.locale)
+        
+        first_names = self._distinct_names(pool.first_names, self.cardinality)
+        last_names = self._distinct_names(pool.last_names, self.cardinality)
+        rng.shuffle(first_names)
+        rng.shuffle(last_names)
+        
+        people = rng.integers(0, self.cardinality, size=self.rows)
+        first = first_names[people]
+        last = last_names[(people * 7919) % self.cardinality]
+        domains = np.array(DOMAINS, dtype=object)[people % len(DOMAINS)]
+        
+        columns = {
+            'first_name': first,
+            'last_name': last,
+            'full_name': first + ' ' + last,
+            'full_name_inverted': last + ' ' + first,
+            'email': np.array([
+                f"{first_name}.{last_name}@{domain}".lower()
+                for first_name, last_name, domain in zip(first, last, domains)
+            ], dtype=object),
+            'id': np.array([f"EMP{person:08d}" for person in people], dtype=object),
+            'misc': np.array([f"Note {row}" for row in range(self.rows)], dtype=object)
+        }
+        
+        data = {COLUMN_NAMES[column_type]: columns[column_type] for column_type in self.column_types}
+        data['Department'] = np.array(DEPARTMENTS, dtype=object)[rng.integers(0, len(DEPARTMENTS), size=self.rows)]
+        return pd.DataFrame(data)
+    
+    def write_csv(self, path: str) -> None:
+        self.generate().to_csv(path, index=False)
+    
+    def write_excel(self, path: str) -> None:
+        self.generate().to_excel(path, index=False, engine='openpyxl')
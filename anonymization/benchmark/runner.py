@@ -0,0 +1,199 @@
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from anonymization.benchmark.dataset import SyntheticDatasetGenerator
+
+
+PATHS = ['dataframe', 'csv', 'excel']
+
+STARTUP_RUNS = 3
+
+PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return _psutil_peak_mb()
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _psutil_peak_mb() -> Optional[float]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    
+    memory = psutil.Process().memory_info()
+    return getattr(memory, 'peak_wset', memory.rss) / (1024 * 1024)
+
+
+def _run_case(path: str,
+              input_path: str,
+              output_path: str,
+              column_config: Dict[str, str],
+              options: Dict[str, Any],
+              profile: bool) -> Dict[str, Any]:
+    from anonymization.core.anonymizer import Anonymizer
+    from anonymization.core.profiler import AnonymizationProfiler
+    
+    stages: Dict[str, float] = {}
+    profiler = AnonymizationProfiler() if profile else None
+    
+    start = time.perf_counter()
+    anonymizer = Anonymizer(column_config=column_config, salt=b'benchmark' * 4, profiler=profiler, **options)
+    stages['setup'] = time.perf_counter() - start
+    
+    if path == 'dataframe':
+        start = time.perf_counter()
+        df = pd.read_csv(input_path, dtype={column_name: str for column_name in column_config})
+        stages['read'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        anonymizer.anonymize_dataframe(df)
+        stages['anonymize'] = time.perf_counter() - start
+    elif path == 'csv':
+        start = time.perf_counter()
+        anonymizer.anonymize_csv(input_path, output_path)
+        stages['anonymize_csv'] = time.perf_counter() - start
+    elif path == 'excel':
+        start = time.perf_counter()
+        anonymizer.anonymize_excel(input_path, output_path)
+        stages['anonymize_excel'] = time.perf_counter() - start
+    else:
+        raise ValueError(f"Unknown benchmark path: {path}")
+    
+    anonymizer.close()
+    
+    peak_rss_mb = _peak_rss_mb()
+    result = {
+        'seconds': sum(stages.values()),
+        'stages': stages,
+        'peak_rss_mb': round(peak_rss_mb, 1) if peak_rss_mb is not None else None
+    }
+    if profiler is not None:
+        result['profile'] = profiler.report()
+    return result
+
+
+class BenchmarkRunner:
+    
+    def __init__(self,
+                 generator: SyntheticDatasetGenerator,
+                 work_dir: str,
+                 paths: Optional[List[str]] = None,
+                 options: Optional[Dict[str, Any]] = None,
+                 profile: bool = False):
+        self.generator = generator
+        self.work_dir = Path(work_dir)
+        self.paths = paths or list(PATHS)
+        self.options = options or {}
+        self.profile = profile
+        
+        unknown = [path for path in self.paths if path not in PATHS]
+        if unknown:
+            raise ValueError(f"Unknown benchmark paths: {', '.join(unknown)}")
+    
+    def run(self) -> Dict[str, Any]:
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        csv_path = str(self.work_dir / 'bench_input.csv')
+        excel_path = str(self.work_dir / 'bench_input.xlsx')
+        
+        start = time.perf_counter()
+        self.generator.write_csv(csv_path)
+        generate_seconds = time.perf_counter() - start
+        if 'excel' in self.paths:
+            self.generator.write_excel(excel_path)
+        
+        column_config = self.generator.column_config()
+        results: Dict[str, Any] = {}
+        
+        for path in self.paths:
+            input_path = excel_path if path == 'excel' else csv_path
+            output_path = str(self.work_dir / f"bench_output{Path(input_path).suffix}")
+            results[path] = self._measure(path, input_path, output_path, column_config)
+        
+        handlers: Dict[str, Any] = {}
+        if 'dataframe' in self.paths:
+            for column_name, column_type in column_config.items():
+                handlers[column_type] = self._measure('dataframe', csv_path, '', {column_name: column_type})
+        
+        return {
+            'environment': self._environment(),
+            'dataset': {
+                'rows': self.generator.rows,
+                'cardinality': self.generator.cardinality,
+                'locale': self.generator.locale,
+                'column_types': self.generator.column_types,
+                'generate_seconds': generate_seconds
+            },
+            'options': self.options,
+            'startup': self._measure_startup(csv_path, excel_path if 'excel' in self.paths else None),
+            'paths': results,
+            'handlers': handlers
+        }
+    
+    def _measure_startup(self, csv_path: str, excel_path: Optional[str]) -> Dict[str, float]:
+        commands = {
+            'import_package': 'import anonymization',
+            'import_cli': 'import anonymization.cli.cli',
+            'columns_csv': self._cli_script(['columns', csv_path])
+        }
+        if excel_path is not None:
+            commands['columns_excel'] = self._cli_script(['columns', excel_path])
+        
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PACKAGE_ROOT, os.environ.get('PYTHONPATH')])))
+        startup: Dict[str, float] = {}
+        for name, script in commands.items():
+            timings = []
+            for _ in range(STARTUP_RUNS):
+                start = time.perf_counter()
+                subprocess.run([sys.executable, '-c', script], env=env, check=True, stdout=subprocess.DEVNULL)
+                timings.append(time.perf_counter() - start)
+            startup[name] = min(timings)
+        return startup
+    
+    @staticmethod
+    def _cli_script(arguments: List[str]) -> str:
+        return f"import sys; sys.argv = ['chameleon'] + {arguments!r}; from anonymization.cli.cli import main; main()"
+    
+    def _measure(self, path: str, input_path: str, output_path: str, column_config: Dict[str, str]) -> Dict[str, Any]:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(
+                _run_case, path, input_path, output_path, column_config, self.options, self.profile
+            ).result()
+        
+        result['rows_per_sec'] = self.generator.rows / result['seconds'] if result['seconds'] else None
+        return result
+    
+    def _environment(self) -> Dict[str, Any]:
+        try:
+            version = metadata.version('namechameleon')
+        except metadata.PackageNotFoundError:
+            version = 'unknown'
+        
+        return {
+            'namechameleon': version,
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform()
+        }
+    
+    @staticmethod
+    def to_json(report: Dict[str, Any]) -> str:
+        return json.dumps(report, indent=2)
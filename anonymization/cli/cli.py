@@ -1,7 +1,8 @@
 import argparse
 import sys
 
-from anonymization.cli.commands import AnonymizeCommand, ShowColumnsCommand
+from anonymization.cli.commands import AnonymizeCommand, BenchCommand, ServeCommand, ShardCommand, ShowColumnsCommand
+from anonymization.utils.hasher import DEFAULT_HASH_CACHE_SIZE
 
 
 def main() -> None:
@@ -33,6 +34,65 @@ def main() -> None:
         default='en_US',
         help='Locale for name generation (default: en_US)'
     )
+    anonymize_parser.add_argument(
+        '--deterministic-names',
+        action='store_true',
+        help='Derive names purely from the salted hash so results do not depend on row order'
+    )
+    anonymize_parser.add_argument(
+        '--chunksize',
+        type=int,
+        help='Process the input in chunks of N rows to bound memory use'
+    )
+    anonymize_parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for hashing (default: 1)'
+    )
+    anonymize_parser.add_argument(
+        '--engine',
+        choices=['python', 'pyarrow'],
+        default='python',
+        help='String engine: pyarrow keeps configured columns as Arrow strings and normalizes them in bulk (default: python)'
+    )
+    anonymize_parser.add_argument(
+        '--passthrough',
+        action='store_true',
+        help='Copy unconfigured CSV columns as raw text without type inference or NA conversion'
+    )
+    anonymize_parser.add_argument(
+        '--hash-cache-size',
+        type=int,
+        default=DEFAULT_HASH_CACHE_SIZE,
+        help=f'Normalized tokens whose hashes are kept in memory, 0 to disable (default: {DEFAULT_HASH_CACHE_SIZE})'
+    )
+    anonymize_parser.add_argument(
+        '--name-cache-entries',
+        type=int,
+        help='Keep at most N pseudonyms per name kind in memory and spill the rest to a temporary file'
+    )
+    anonymize_parser.add_argument(
+        '--vault',
+        help='SQLite file that stores pseudonyms across runs with the same salt'
+    )
+    anonymize_parser.add_argument(
+        '--mapping',
+        help='Reuse the pseudonyms stored in a mapping file written by --export-mapping or shard merge'
+    )
+    anonymize_parser.add_argument(
+        '--export-mapping',
+        help='Write the pseudonyms handed out by this run to a compact mapping file'
+    )
+    anonymize_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print per-stage timings and name cache statistics after anonymization'
+    )
+    anonymize_parser.add_argument(
+        '--profile-json',
+        help='Write the profiling report as JSON to this file'
+    )
     anonymize_parser.add_argument(
         '--show-salt',
         action='store_true',
@@ -42,6 +102,161 @@ def main() -> None:
     columns_parser = subparsers.add_parser('columns', help='Show columns in a file')
     columns_parser.add_argument('input', help='Input file path (CSV or Excel)')
     
+    bench_parser = subparsers.add_parser('bench', help='Benchmark anonymization on synthetic data')
+    bench_parser.add_argument(
+        '--rows',
+        type=int,
+        default=100_000,
+        help='Number of rows to generate (default: 100000)'
+    )
+    bench_parser.add_argument(
+        '--cardinality',
+        type=int,
+        default=5_000,
+        help='Number of distinct people in the data (default: 5000)'
+    )
+    bench_parser.add_argument(
+        '--locale',
+        default='en_US',
+        help='Locale for generated and anonymized names (default: en_US)'
+    )
+    bench_parser.add_argument(
+        '--columns',
+        help='Comma-separated column types to include (default: all)'
+    )
+    bench_parser.add_argument(
+        '--paths',
+        help='Comma-separated paths to run: dataframe, csv, excel (default: all)'
+    )
+    bench_parser.add_argument(
+        '--workdir',
+        default='bench',
+        help='Directory for generated input and output files (default: bench)'
+    )
+    bench_parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes passed to the Anonymizer (default: 1)'
+    )
+    bench_parser.add_argument(
+        '--engine',
+        choices=['python', 'pyarrow'],
+        default='python',
+        help='String engine passed to the Anonymizer (default: python)'
+    )
+    bench_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Include per-stage profiling in each case (adds timing overhead)'
+    )
+    bench_parser.add_argument(
+        '-o', '--output',
+        help='Write the JSON report to this file instead of stdout'
+    )
+    
+    serve_parser = subparsers.add_parser('serve', help='Run a long-lived anonymization service over HTTP')
+    serve_parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen on (default: 127.0.0.1)'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='TCP port to listen on (default: 8765)'
+    )
+    serve_parser.add_argument(
+        '--socket',
+        help='Listen on this Unix socket instead of TCP'
+    )
+    serve_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Requests processed at the same time (default: 4)'
+    )
+    serve_parser.add_argument(
+        '--max-pending',
+        type=int,
+        default=64,
+        help='Requests accepted before answering 503 Service Unavailable (default: 64)'
+    )
+    serve_parser.add_argument(
+        '--max-anonymizers',
+        type=int,
+        default=16,
+        help='Warm anonymizers kept per (salt, locale, config) (default: 16)'
+    )
+    serve_parser.add_argument(
+        '--engine',
+        choices=['python', 'pyarrow'],
+        default='python',
+        help='String engine for the anonymizers (default: python)'
+    )
+    serve_parser.add_argument(
+        '--data-dir',
+        help='Allow file requests, with input and output paths confined to this directory (default: rows only)'
+    )
+    
+    shard_parser = subparsers.add_parser('shard', help='Anonymize CSV shards in two phases with one shared name mapping')
+    shard_subparsers = shard_parser.add_subparsers(dest='shard_command', help='Shard phases')
+    
+    shard_scan_parser = shard_subparsers.add_parser('scan', help='Phase one: record the name digests of one shard')
+    shard_scan_parser.add_argument('input', help='Input CSV shard')
+    shard_scan_parser.add_argument('output', help='Scan file to write')
+    
+    shard_merge_parser = shard_subparsers.add_parser('merge', help='Merge scan files into one name mapping')
+    shard_merge_parser.add_argument('inputs', nargs='+', help='Scan files, in shard order')
+    shard_merge_parser.add_argument('-o', '--output', required=True, help='Mapping file to write')
+    
+    shard_apply_parser = shard_subparsers.add_parser('apply', help='Phase two: anonymize one shard with the mapping')
+    shard_apply_parser.add_argument('input', help='Input shard')
+    shard_apply_parser.add_argument('output', help='Output file path')
+    shard_apply_parser.add_argument('-m', '--mapping', required=True, help='Mapping file from the merge step')
+    
+    shard_run_parser = shard_subparsers.add_parser('run', help='Run scan, merge and apply locally with worker processes')
+    shard_run_parser.add_argument('inputs', nargs='+', help='Input CSV shards, in order')
+    shard_run_parser.add_argument('-o', '--output-dir', required=True, help='Directory for the anonymized shards')
+    shard_run_parser.add_argument(
+        '--workdir',
+        help='Directory for scan and mapping files (default: OUTPUT_DIR/.shards)'
+    )
+    shard_run_parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of shards processed at the same time (default: 1)'
+    )
+    
+    for phase_parser in [shard_scan_parser, shard_merge_parser, shard_apply_parser, shard_run_parser]:
+        phase_parser.add_argument(
+            '-c', '--config',
+            required=True,
+            help='JSON config file with column mappings'
+        )
+        phase_parser.add_argument(
+            '--salt',
+            required=phase_parser is not shard_run_parser,
+            help='Salt as hex string, identical for every phase and shard'
+        )
+        phase_parser.add_argument(
+            '--locale',
+            default='en_US',
+            help='Locale for name generation (default: en_US)'
+        )
+        phase_parser.add_argument(
+            '--deterministic-names',
+            action='store_true',
+            help='Derive names purely from the salted hash'
+        )
+        phase_parser.add_argument(
+            '--chunksize',
+            type=int,
+            help='Process each shard in chunks of N rows to bound memory use'
+        )
+    
     args = parser.parse_args()
     
     if args.command == 'anonymize':
@@ -52,9 +267,62 @@ def main() -> None:
             interactive=args.interactive,
             salt=args.salt,
             locale=args.locale,
+            deterministic_names=args.deterministic_names,
+            chunksize=args.chunksize,
+            workers=args.workers,
+            engine=args.engine,
+            passthrough=args.passthrough,
+            hash_cache_size=args.hash_cache_size,
+            name_cache_entries=args.name_cache_entries,
+            vault_path=args.vault,
+            mapping_path=args.mapping,
+            export_mapping_path=args.export_mapping,
+            profile=args.profile,
+            profile_json=args.profile_json,
             show_salt=args.show_salt
         )
         command.execute()
+    elif args.command == 'bench':
+        command = BenchCommand(
+            rows=args.rows,
+            cardinality=args.cardinality,
+            locale=args.locale,
+            column_types=args.columns.split(',') if args.columns else None,
+            paths=args.paths.split(',') if args.paths else None,
+            work_dir=args.workdir,
+            output_path=args.output,
+            workers=args.workers,
+            engine=args.engine,
+            profile=args.profile
+        )
+        command.execute()
+    elif args.command == 'serve':
+        command = ServeCommand(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            concurrency=args.concurrency,
+            max_pending=args.max_pending,
+            max_anonymizers=args.max_anonymizers,
+            engine=args.engine,
+            data_dir=args.data_dir
+        )
+        command.execute()
+    elif args.command == 'shard' and args.shard_command:
+        command = ShardCommand(
+            action=args.shard_command,
+            input_paths=args.inputs if 'inputs' in args else [args.input],
+            output_path=args.output_dir if args.shard_command == 'run' else args.output,
+            config_path=args.config,
+            salt=args.salt,
+            locale=args.locale,
+            deterministic_names=args.deterministic_names,
+            chunksize=args.chunksize,
+            mapping_path=getattr(args, 'mapping', None),
+            work_dir=getattr(args, 'workdir', None),
+            workers=getattr(args, 'workers', 1)
+        )
+        command.execute()
     elif args.command == 'columns':
         command = ShowColumnsCommand(args.input)
         command.execute()
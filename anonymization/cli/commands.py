@@ -1,12 +1,15 @@
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from anonymization.core.anonymizer import Anonymizer
+from anonymization.utils.hasher import DEFAULT_HASH_CACHE_SIZE
 from anonymization.cli.file_handlers import get_file_handler, ExcelFileHandler
 from anonymization.cli.config_builder import InteractiveConfigBuilder, FileConfigBuilder
 
+if TYPE_CHECKING:
+    from anonymization.core.anonymizer import Anonymizer
+
 
 class Command(ABC):
     
@@ -34,6 +37,18 @@ class AnonymizeCommand(Command):
                  interactive: bool = False,
                  salt: Optional[str] = None,
                  locale: str = 'en_US',
+                 deterministic_names: bool = False,
+                 chunksize: Optional[int] = None,
+                 workers: int = 1,
+                 engine: str = 'python',
+                 passthrough: bool = False,
+                 hash_cache_size: int = DEFAULT_HASH_CACHE_SIZE,
+                 name_cache_entries: Optional[int] = None,
+                 vault_path: Optional[str] = None,
+                 mapping_path: Optional[str] = None,
+                 export_mapping_path: Optional[str] = None,
+                 profile: bool = False,
+                 profile_json: Optional[str] = None,
                  show_salt: bool = False):
         self.input_path = input_path
         self.output_path = output_path
@@ -41,9 +56,24 @@ class AnonymizeCommand(Command):
         self.interactive = interactive
         self.salt = salt
         self.locale = locale
+        self.deterministic_names = deterministic_names
+        self.chunksize = chunksize
+        self.workers = workers
+        self.engine = engine
+        self.passthrough = passthrough
+        self.hash_cache_size = hash_cache_size
+        self.name_cache_entries = name_cache_entries
+        self.vault_path = vault_path
+        self.mapping_path = mapping_path
+        self.export_mapping_path = export_mapping_path
+        self.profile = profile
+        self.profile_json = profile_json
         self.show_salt = show_salt
     
     def execute(self) -> None:
+        from anonymization.core.anonymizer import Anonymizer
+        from anonymization.core.profiler import AnonymizationProfiler
+        
         column_config = self._build_config()
         
         if not column_config:
@@ -55,17 +85,44 @@ class AnonymizeCommand(Command):
             print(f"  {col} -> {col_type}")
         
         salt_bytes = bytes.fromhex(self.salt) if self.salt else None
+        profiler = AnonymizationProfiler() if self.profile or self.profile_json else None
         
         anonymizer = Anonymizer(
             column_config=column_config,
             salt=salt_bytes,
-            locale=self.locale
+            locale=self.locale,
+            deterministic_names=self.deterministic_names,
+            workers=self.workers,
+            engine=self.engine,
+            passthrough=self.passthrough,
+            hash_cache_size=self.hash_cache_size,
+            name_cache_entries=self.name_cache_entries,
+            vault_path=self.vault_path,
+            profiler=profiler
         )
         
-        self._anonymize_file(anonymizer)
+        try:
+            if self.mapping_path:
+                self._load_mapping(anonymizer)
+            self._anonymize_file(anonymizer)
+            if self.export_mapping_path:
+                anonymizer.export_mapping(self.export_mapping_path)
+        finally:
+            anonymizer.close()
         
         print(f"\n✓ Anonymized file saved to: {self.output_path}")
         
+        if self.export_mapping_path:
+            print(f"✓ Mapping saved to: {self.export_mapping_path}")
+        
+        if self.profile:
+            print("\nProfile:")
+            print(profiler.format_table())
+        
+        if self.profile_json:
+            Path(self.profile_json).write_text(profiler.to_json())
+            print(f"\n✓ Profile saved to: {self.profile_json}")
+        
         if self.show_salt:
             salt_hex = anonymizer.get_salt().hex()
             print(f"\nSalt (save for reproducibility): {salt_hex}")
@@ -89,14 +146,173 @@ class AnonymizeCommand(Command):
             print("Error: Must specify either --config or --interactive")
             sys.exit(1)
     
-    def _anonymize_file(self, anonymizer: Anonymizer) -> None:
-        input_path = Path(self.input_path)
-        suffix = input_path.suffix.lower()
-        
-        if suffix == '.csv':
-            anonymizer.anonymize_csv(self.input_path, self.output_path)
-        elif suffix in ['.xlsx', '.xls']:
-            anonymizer.anonymize_excel(self.input_path, self.output_path)
+    def _load_mapping(self, anonymizer: 'Anonymizer') -> None:
+        try:
+            anonymizer.load_mapping(self.mapping_path)
+        except (ValueError, FileNotFoundError) as error:
+            print(f"Error: {error}")
+            sys.exit(1)
+    
+    def _anonymize_file(self, anonymizer: 'Anonymizer') -> None:
+        try:
+            file_handler = get_file_handler(self.input_path)
+        except ValueError as error:
+            print(f"Error: {error}")
+            sys.exit(1)
+        
+        file_handler.anonymize(anonymizer, self.output_path, chunksize=self.chunksize)
+
+
+class BenchCommand(Command):
+    
+    def __init__(self,
+                 rows: int,
+                 cardinality: int,
+                 locale: str = 'en_US',
+                 column_types: Optional[list[str]] = None,
+                 paths: Optional[list[str]] = None,
+                 work_dir: str = 'bench',
+                 output_path: Optional[str] = None,
+                 workers: int = 1,
+                 engine: str = 'python',
+                 profile: bool = False):
+        self.rows = rows
+        self.cardinality = cardinality
+        self.locale = locale
+        self.column_types = column_types
+        self.paths = paths
+        self.work_dir = work_dir
+        self.output_path = output_path
+        self.workers = workers
+        self.engine = engine
+        self.profile = profile
+    
+    def execute(self) -> None:
+        from anonymization.benchmark.dataset import SyntheticDatasetGenerator
+        from anonymization.benchmark.runner import BenchmarkRunner
+        
+        generator = SyntheticDatasetGenerator(
+            rows=self.rows,
+            cardinality=self.cardinality,
+            locale=self.locale,
+            column_types=self.column_types
+        )
+        runner = BenchmarkRunner(
+            generator,
+            work_dir=self.work_dir,
+            paths=self.paths,
+            options={'locale': self.locale, 'workers': self.workers, 'engine': self.engine},
+            profile=self.profile
+        )
+        
+        report_json = BenchmarkRunner.to_json(runner.run())
+        
+        if self.output_path:
+            Path(self.output_path).write_text(report_json)
+            print(f"✓ Benchmark report saved to: {self.output_path}")
         else:
-            print(f"Error: Unsupported file format: {suffix}")
+            print(report_json)
+
+
+class ServeCommand(Command):
+    
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 8765,
+                 socket_path: Optional[str] = None,
+                 concurrency: int = 4,
+                 max_pending: int = 64,
+                 max_anonymizers: int = 16,
+                 engine: str = 'python',
+                 data_dir: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.max_anonymizers = max_anonymizers
+        self.engine = engine
+        self.data_dir = data_dir
+    
+    def execute(self) -> None:
+        import asyncio
+        from anonymization.service.server import AnonymizationServer
+        
+        server = AnonymizationServer(
+            host=self.host,
+            port=self.port,
+            socket_path=self.socket_path,
+            concurrency=self.concurrency,
+            max_pending=self.max_pending,
+            max_anonymizers=self.max_anonymizers,
+            anonymizer_options={'engine': self.engine},
+            data_dir=self.data_dir
+        )
+        
+        print(f"Serving on {server.address} (Ctrl+C to stop)")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            print("\nStopped")
+
+
+class ShardCommand(Command):
+    
+    def __init__(self,
+                 action: str,
+                 input_paths: list[str],
+                 output_path: str,
+                 config_path: str,
+                 salt: Optional[str] = None,
+                 locale: str = 'en_US',
+                 deterministic_names: bool = False,
+                 chunksize: Optional[int] = None,
+                 mapping_path: Optional[str] = None,
+                 work_dir: Optional[str] = None,
+                 workers: int = 1):
+        self.action = action
+        self.input_paths = input_paths
+        self.output_path = output_path
+        self.config_path = config_path
+        self.salt = salt
+        self.locale = locale
+        self.deterministic_names = deterministic_names
+        self.chunksize = chunksize
+        self.mapping_path = mapping_path
+        self.work_dir = work_dir
+        self.workers = workers
+    
+    def execute(self) -> None:
+        import secrets
+        from anonymization.distributed.sharding import ShardedAnonymizer, LocalShardRunner
+        
+        salt_bytes = bytes.fromhex(self.salt) if self.salt else secrets.token_bytes(32)
+        sharded = ShardedAnonymizer(
+            column_config=FileConfigBuilder(self.config_path).build(),
+            salt=salt_bytes,
+            locale=self.locale,
+            deterministic_names=self.deterministic_names,
+            chunksize=self.chunksize
+        )
+        
+        try:
+            if self.action == 'scan':
+                sharded.scan(self.input_paths[0], self.output_path)
+                print(f"✓ Scan saved to: {self.output_path}")
+            elif self.action == 'merge':
+                sharded.merge(self.input_paths, self.output_path)
+                print(f"✓ Mapping saved to: {self.output_path}")
+            elif self.action == 'apply':
+                sharded.apply(self.input_paths[0], self.output_path, self.mapping_path)
+                print(f"✓ Anonymized shard saved to: {self.output_path}")
+            else:
+                mapping_path = LocalShardRunner(sharded, workers=self.workers).run(
+                    self.input_paths, self.output_path, self.work_dir
+                )
+                print(f"✓ {len(self.input_paths)} anonymized shards saved to: {self.output_path}")
+                print(f"✓ Mapping saved to: {mapping_path}")
+                if not self.salt:
+                    print(f"\nSalt (needed to extend this run): {salt_bytes.hex()}")
+        except (ValueError, FileNotFoundError) as error:
+            print(f"Error: {error}")
             sys.exit(1)
@@ -3,8 +3,6 @@ import json
 from pathlib import Path
 from typing import Dict
 
-from anonymization.cli.interactive_column_mapper import ColumnMappingUI
-
 
 class ConfigBuilder(ABC):
     
@@ -19,6 +17,8 @@ class InteractiveConfigBuilder(ConfigBuilder):
         self.columns = columns
     
     def build(self) -> Dict[str, str]:
+        from anonymization.cli.interactive_column_mapper import ColumnMappingUI
+        
         ui = ColumnMappingUI(self.columns)
         return ui.run()
 
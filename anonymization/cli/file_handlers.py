@@ -1,7 +1,32 @@
+import csv
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
-import pandas as pd
+from typing import Any, Optional
+from anonymization.utils.dependencies import import_pyarrow
+
+
+EXCEL_SUFFIXES = ['.xlsx', '.xls']
+
+PARQUET_SUFFIXES = ['.parquet', '.pq']
+
+ARROW_SUFFIXES = ['.arrow', '.feather', '.ipc']
+
+
+def deduplicate_columns(columns: list[Any]) -> list[Any]:
+    columns = list(columns)
+    counts: dict[Any, int] = {}
+    
+    for i, col in enumerate(columns):
+        base = col
+        count = counts.get(col, 0)
+        while count > 0:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in columns else counts.get(col, 0)
+        columns[i] = col
+        counts[col] = count + 1
+    
+    return columns
 
 
 class FileHandler(ABC):
@@ -22,13 +47,19 @@ class FileHandler(ABC):
     @abstractmethod
     def show_info(self) -> None:
         pass
+    
+    @abstractmethod
+    def anonymize(self, anonymizer: Any, output_path: str, chunksize: Optional[int] = None) -> None:
+        pass
 
 
 class CsvFileHandler(FileHandler):
     
     def detect_columns(self) -> list[str]:
-        df = pd.read_csv(self.file_path, nrows=0)
-        return df.columns.tolist()
+        with open(self.file_path, newline='', encoding='utf-8-sig') as file:
+            header = next(csv.reader(file), [])
+        
+        return deduplicate_columns([col if col else f"Unnamed: {i}" for i, col in enumerate(header)])
     
     def show_info(self) -> None:
         columns = self.detect_columns()
@@ -36,18 +67,81 @@ class CsvFileHandler(FileHandler):
         for i, col in enumerate(columns, 1):
             print(f"  {i}. {col}")
         print()
+    
+    def anonymize(self, anonymizer: Any, output_path: str, chunksize: Optional[int] = None) -> None:
+        anonymizer.anonymize_csv(self.file_path, output_path, chunksize=chunksize)
 
 
 class ExcelFileHandler(FileHandler):
     
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._sheet_columns: Optional[dict[str, list[Any]]] = None
+    
+    def sheet_columns(self) -> dict[str, list[Any]]:
+        if self._sheet_columns is None:
+            if self.path.suffix.lower() == '.xls':
+                self._sheet_columns = self._read_headers_with_pandas()
+            else:
+                self._sheet_columns = self._read_headers()
+        return self._sheet_columns
+    
+    def _read_headers(self) -> dict[str, list[Any]]:
+        import openpyxl
+        
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            sheet_columns = {}
+            for worksheet in workbook.worksheets:
+                header = self._trimmed(next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+                sheet_columns[worksheet.title] = self._column_names(header, self._sheet_width(worksheet, len(header)))
+            return sheet_columns
+        finally:
+            workbook.close()
+    
+    def _read_headers_with_pandas(self) -> dict[str, list[Any]]:
+        import pandas as pd
+        
+        headers = pd.read_excel(self.file_path, sheet_name=None, nrows=0)
+        return {sheet_name: df.columns.tolist() for sheet_name, df in headers.items()}
+    
+    def _sheet_width(self, worksheet: Any, header_width: int) -> int:
+        max_width = worksheet.max_column
+        if max_width is None or max_width <= header_width:
+            return header_width
+        
+        width = header_width
+        for row in worksheet.iter_rows(min_row=2, min_col=header_width + 1, max_col=max_width, values_only=True):
+            width = max(width, header_width + len(self._trimmed(row)))
+            if width == max_width:
+                break
+        return width
+    
+    @staticmethod
+    def _trimmed(row: tuple[Any, ...]) -> list[Any]:
+        values = list(row)
+        while values and values[-1] in (None, ''):
+            values.pop()
+        return values
+    
+    @staticmethod
+    def _column_names(header: list[Any], width: int) -> list[Any]:
+        values = header + [None] * (width - len(header))
+        
+        columns = []
+        for i, value in enumerate(values):
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            columns.append(value if value not in (None, '') else f"Unnamed: {i}")
+        
+        return deduplicate_columns(columns)
+    
     def detect_columns(self) -> list[str]:
-        xl = pd.ExcelFile(self.file_path)
         all_columns = []
         seen = set()
         
-        for sheet_name in xl.sheet_names:
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name, nrows=0)
-            for col in df.columns:
+        for columns in self.sheet_columns().values():
+            for col in columns:
                 if col not in seen:
                     all_columns.append(col)
                     seen.add(col)
@@ -55,13 +149,11 @@ class ExcelFileHandler(FileHandler):
         return all_columns
     
     def show_info(self) -> None:
-        xl = pd.ExcelFile(self.file_path)
         print(f"\nColumns in '{self.file_path}':")
         
-        for sheet_name in xl.sheet_names:
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name, nrows=0)
+        for sheet_name, columns in self.sheet_columns().items():
             print(f"\n  Sheet: {sheet_name}")
-            for i, col in enumerate(df.columns, 1):
+            for i, col in enumerate(columns, 1):
                 print(f"    {i}. {col}")
         
         print(f"\n  Unique columns across all sheets:")
@@ -69,6 +161,47 @@ class ExcelFileHandler(FileHandler):
         for i, col in enumerate(unique_cols, 1):
             print(f"    {i}. {col}")
         print()
+    
+    def anonymize(self, anonymizer: Any, output_path: str, chunksize: Optional[int] = None) -> None:
+        anonymizer.anonymize_excel(self.file_path, output_path, chunksize=chunksize)
+
+
+class ArrowSchemaFileHandler(FileHandler):
+    
+    @abstractmethod
+    def _read_schema(self) -> Any:
+        pass
+    
+    def detect_columns(self) -> list[str]:
+        return list(self._read_schema().names)
+    
+    def show_info(self) -> None:
+        schema = self._read_schema()
+        print(f"\nColumns in '{self.file_path}':")
+        for i, field in enumerate(schema, 1):
+            print(f"  {i}. {field.name} ({field.type})")
+        print()
+
+
+class ParquetFileHandler(ArrowSchemaFileHandler):
+    
+    def _read_schema(self) -> Any:
+        _, pq = import_pyarrow()
+        return pq.read_schema(self.file_path)
+    
+    def anonymize(self, anonymizer: Any, output_path: str, chunksize: Optional[int] = None) -> None:
+        anonymizer.anonymize_parquet(self.file_path, output_path, chunksize=chunksize)
+
+
+class ArrowFileHandler(ArrowSchemaFileHandler):
+    
+    def _read_schema(self) -> Any:
+        pa, _ = import_pyarrow()
+        with pa.memory_map(self.file_path) as source:
+            return pa.ipc.open_file(source).schema
+    
+    def anonymize(self, anonymizer: Any, output_path: str, chunksize: Optional[int] = None) -> None:
+        anonymizer.anonymize_arrow(self.file_path, output_path, chunksize=chunksize)
 
 
 def get_file_handler(file_path: str) -> FileHandler:
@@ -77,8 +210,12 @@ def get_file_handler(file_path: str) -> FileHandler:
     
     if suffix == '.csv':
         return CsvFileHandler(file_path)
-    elif suffix in ['.xlsx', '.xls']:
+    elif suffix in EXCEL_SUFFIXES:
         return ExcelFileHandler(file_path)
+    elif suffix in PARQUET_SUFFIXES:
+        return ParquetFileHandler(file_path)
+    elif suffix in ARROW_SUFFIXES:
+        return ArrowFileHandler(file_path)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
@@ -1,8 +1,17 @@
-from typing import Dict, Optional
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import islice, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
-from anonymization.utils.hasher import DeterministicHasher
-from anonymization.utils.normalizer import StringNormalizer, IdNormalizer
+from anonymization.utils.hasher import DeterministicHasher, DEFAULT_HASH_CACHE_SIZE
+from anonymization.utils.normalizer import StringNormalizer, IdNormalizer, ArrowStringNormalizer, ArrowIdNormalizer
 from anonymization.utils.name_generator import NameGenerator
+from anonymization.utils.mapping_table import MappingTable
+from anonymization.utils.pseudonym_vault import PseudonymVault
+from anonymization.utils.dependencies import import_pyarrow
 from anonymization.core.column_handlers import (
     FirstNameHandler,
     LastNameHandler,
@@ -13,6 +22,53 @@ from anonymization.core.column_handlers import (
     MiscHandler,
     BaseColumnHandler
 )
+from anonymization.core.profiler import AnonymizationProfiler
+
+
+PARALLEL_MIN_VALUES = 10_000
+
+ARROW_BATCH_SIZE = 65_536
+
+ENGINES = ('python', 'pyarrow')
+
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+_worker_anonymizer = None
+
+
+def _init_worker(anonymizer_class: type, options: Dict[str, Any]) -> None:
+    global _worker_anonymizer
+    _worker_anonymizer = anonymizer_class(**options)
+
+
+def _factorize(series: pd.Series) -> Tuple[np.ndarray, Sequence[Any]]:
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    if series.dtype != object or pd.api.types.infer_dtype(uniques, skipna=True) in ('string', 'empty'):
+        return codes, uniques
+    
+    values = series.to_numpy()
+    type_codes, types = pd.factorize(np.fromiter((type(value) for value in values), dtype=object, count=len(values)))
+    if len(types) == 1:
+        return codes, uniques
+    
+    codes, _ = pd.factorize(codes * len(types) + type_codes)
+    _, first_positions = np.unique(codes, return_index=True)
+    return codes, values[first_positions]
+
+
+def _skips_prepare(handler: BaseColumnHandler) -> bool:
+    return type(handler).anonymize_batch is not BaseColumnHandler.anonymize_batch or handler.overrides_anonymize()
+
+
+def _prepare_in_worker(column_name: str, values: Sequence[Any]) -> List[Any]:
+    return _worker_anonymizer.handlers[column_name].prepare_many(values)
+
+
+def _prepare_sheet_in_worker(input_path: str, sheet_name: str) -> Tuple[pd.DataFrame, Dict[str, Tuple[np.ndarray, Sequence[Any]]]]:
+    return _worker_anonymizer._prepare_sheet(input_path, sheet_name)
 
 
 class Anonymizer:
@@ -20,22 +76,61 @@ class Anonymizer:
     def __init__(self, 
                  column_config: Dict[str, str],
                  salt: Optional[bytes] = None,
-                 locale: str = 'en_US'):
+                 locale: str = 'en_US',
+                 deterministic_names: bool = False,
+                 workers: int = 1,
+                 vault_path: Optional[str] = None,
+                 profiler: Optional[AnonymizationProfiler] = None,
+                 engine: str = 'python',
+                 passthrough: bool = False,
+                 hash_cache_size: int = DEFAULT_HASH_CACHE_SIZE,
+                 name_cache_entries: Optional[int] = None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if engine == 'pyarrow':
+            import_pyarrow()
+        
         self.column_config = column_config
+        self.engine = engine
+        self.passthrough = passthrough
         self.locale = locale
+        self.deterministic_names = deterministic_names
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
         
-        self.hasher = DeterministicHasher(salt)
+        self.hasher = DeterministicHasher(salt, cache_size=hash_cache_size)
         
         salt_bytes = self.hasher.get_salt()
         seed = int.from_bytes(salt_bytes[:8])
-        self.name_generator = NameGenerator(locale, seed=seed)
+        
+        self.fingerprint = PseudonymVault.fingerprint_for(salt_bytes, locale, deterministic_names)
+        
+        self.vault: Optional[PseudonymVault] = None
+        if vault_path is not None:
+            self.vault = PseudonymVault(vault_path, self.fingerprint)
+        
+        self.name_generator = NameGenerator(
+            locale,
+            seed=seed,
+            deterministic=deterministic_names,
+            vault=self.vault,
+            cache_entries=name_cache_entries
+        )
         
         self.handlers: Dict[str, BaseColumnHandler] = {}
         self._initialize_handlers()
+        
+        self.profiler = profiler
+        if profiler is not None:
+            self._instrument_handlers()
     
     def get_handlers(self) -> Dict[str, BaseColumnHandler]:
-        normalizer = StringNormalizer()
-        id_normalizer = IdNormalizer()
+        if self.engine == 'pyarrow':
+            normalizer = ArrowStringNormalizer()
+            id_normalizer = ArrowIdNormalizer()
+        else:
+            normalizer = StringNormalizer()
+            id_normalizer = IdNormalizer()
         
         return {
             'first_name': FirstNameHandler(self.hasher, normalizer, self.name_generator),
@@ -55,28 +150,459 @@ class Anonymizer:
                 raise ValueError(f"Unknown column type: {column_type}")
             self.handlers[column_name] = handler_map[column_type]
     
-    def anonymize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        result_df = df.copy()
+    def _instrument_handlers(self) -> None:
+        unique_handlers = {id(handler): handler for handler in self.handlers.values()}
+        
+        for handler in unique_handlers.values():
+            handler.normalizer = self.profiler.instrument(handler.normalizer, 'normalize', ['normalize', 'normalize_many'])
+            handler.hasher = self.profiler.instrument(handler.hasher, 'hash', ['hash_to_int', 'hash_many', 'digest'])
+            if hasattr(handler, 'name_generator'):
+                handler.name_generator = self.profiler.instrument(
+                    handler.name_generator, 'names', ['get_first_name', 'get_last_name']
+                )
+    
+    @contextmanager
+    def _stage(self, stage: str, column_name: Optional[str] = None) -> Iterator[None]:
+        if self.profiler is None:
+            yield
+            return
+        
+        column = self.profiler.column(column_name) if column_name is not None else nullcontext()
+        with column, self.profiler.stage(stage):
+            yield
+    
+    def _timed(self, items: Iterable[Any], stage: str) -> Iterator[Any]:
+        iterator = iter(items)
+        end = object()
+        while True:
+            with self._stage(stage):
+                item = next(iterator, end)
+            if item is end:
+                return
+            yield item
+    
+    def _worker_options(self) -> Dict[str, Any]:
+        return {
+            'column_config': self.column_config,
+            'salt': self.get_salt(),
+            'locale': self.locale,
+            'deterministic_names': self.deterministic_names,
+            'engine': self.engine,
+            'hash_cache_size': self.hasher.cache_size
+        }
+    
+    @contextmanager
+    def _execution(self) -> Iterator[None]:
+        if self.workers <= 1 or self._pool is not None:
+            try:
+                yield
+            finally:
+                self._finish()
+            return
+        
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(type(self), self._worker_options())
+        )
+        try:
+            yield
+        finally:
+            self._pool.shutdown()
+            self._pool = None
+            self._finish()
+    
+    def _finish(self) -> None:
+        if self.vault is not None:
+            self.vault.flush()
+        if self.profiler is not None:
+            self.profiler.update_counters(self.name_generator.stats)
+            self.profiler.update_counters(self.hasher.stats)
+    
+    def anonymize_dataframe(self,
+                            df: pd.DataFrame,
+                            inplace: bool = False,
+                            columns_only: bool = False) -> Optional[pd.DataFrame]:
+        if inplace and columns_only:
+            raise ValueError("inplace and columns_only cannot be combined")
+        
+        with self._execution():
+            anonymized = {
+                column_name: self._anonymize_series(column_name, df[column_name])
+                for column_name in self.handlers if column_name in df.columns
+            }
+        
+        if columns_only:
+            column_names = [column_name for column_name in df.columns if column_name in anonymized]
+            return pd.DataFrame(anonymized, index=df.index, columns=column_names)
         
+        result_df = df if inplace else df.copy(deep=False)
+        for column_name, series in anonymized.items():
+            result_df[column_name] = series
+        
+        return None if inplace else result_df
+    
+    def _anonymize_series(self, column_name: str, series: pd.Series) -> pd.Series:
+        with self._stage('factorize', column_name):
+            codes, uniques = _factorize(series)
+        anonymized = self._anonymize_values(column_name, uniques)
+        with self._stage('take', column_name):
+            return pd.Series(anonymized.take(codes), index=series.index, name=series.name)
+    
+    def _anonymize_values(self, column_name: str, values: Sequence[Any]) -> np.ndarray:
+        return self._render_values(column_name, self._prepare_values(column_name, values))
+    
+    def _render_values(self, column_name: str, prepared: Sequence[Any]) -> np.ndarray:
+        handler = self.handlers[column_name]
+        with self._stage('render', column_name):
+            if _skips_prepare(handler):
+                return np.fromiter(handler.anonymize_batch(prepared), dtype=object, count=len(prepared))
+            return np.fromiter(handler.render_many(prepared), dtype=object, count=len(prepared))
+    
+    def _prepare_values(self, column_name: str, values: Sequence[Any]) -> Sequence[Any]:
+        handler = self.handlers[column_name]
+        if _skips_prepare(handler):
+            return values
+        
+        with self._stage('prepare', column_name):
+            if (self._pool is None
+                    or len(values) < PARALLEL_MIN_VALUES
+                    or type(handler).prepare is BaseColumnHandler.prepare):
+                return handler.prepare_many(values)
+            
+            batch_size = -(-len(values) // (self.workers * 4))
+            batches = [values[start:start + batch_size] for start in range(0, len(values), batch_size)]
+            
+            prepared = []
+            for batch_result in self._pool.map(_prepare_in_worker, repeat(column_name), batches):
+                prepared.extend(batch_result)
+            return prepared
+    
+    def _text_dtype(self) -> Any:
+        return 'string[pyarrow]' if self.engine == 'pyarrow' else str
+    
+    def _column_dtypes(self) -> Dict[str, Any]:
+        return {column_name: self._text_dtype() for column_name in self.handlers}
+    
+    def _csv_read_options(self) -> Dict[str, Any]:
+        if not self.passthrough:
+            return {'dtype': self._column_dtypes()}
+        
+        return {
+            'dtype': self._text_dtype(),
+            'keep_default_na': False,
+            'na_values': {column_name: CSV_NA_VALUES for column_name in self.handlers}
+        }
+    
+    def anonymize_csv(self, input_path: str, output_path: str, chunksize: Optional[int] = None) -> None:
+        read_options = self._csv_read_options()
+        
+        with self._execution():
+            if chunksize is None:
+                with self._stage('read'):
+                    df = pd.read_csv(input_path, **read_options)
+                self.anonymize_dataframe(df, inplace=True)
+                with self._stage('write'):
+                    df.to_csv(output_path, index=False)
+                return
+            
+            if not self.name_generator.deterministic:
+                self._assign_names_in_file_order(input_path, read_options, chunksize)
+            
+            with pd.read_csv(input_path, chunksize=chunksize, **read_options) as reader, \
+                    open(output_path, 'w', newline='') as output:
+                for chunk_index, chunk in enumerate(self._timed(reader, 'read')):
+                    self.anonymize_dataframe(chunk, inplace=True)
+                    with self._stage('write'):
+                        chunk.to_csv(output, header=chunk_index == 0, index=False)
+    
+    def _name_handlers(self) -> Dict[str, BaseColumnHandler]:
+        return {
+            column_name: handler for column_name, handler in self.handlers.items()
+            if hasattr(handler, 'name_generator')
+        }
+    
+    def _prime_names(self, column_name: str, values: pd.Series) -> None:
+        _, uniques = _factorize(values)
+        self._anonymize_values(column_name, uniques)
+    
+    def _assign_names_in_file_order(self, input_path: str, read_options: Dict[str, Any], chunksize: int) -> None:
+        for column_name, values in self._name_column_chunks(input_path, read_options, chunksize):
+            self._prime_names(column_name, values)
+    
+    def _name_column_chunks(self, input_path: str, read_options: Dict[str, Any], chunksize: int) -> Iterator[Tuple[str, pd.Series]]:
+        header = pd.read_csv(input_path, nrows=0, **read_options).columns
+        
+        for column_name in self._name_handlers():
+            if column_name not in header:
+                continue
+            
+            with pd.read_csv(input_path, usecols=lambda c: c == column_name, chunksize=chunksize,
+                             **read_options) as reader:
+                for chunk in self._timed(reader, 'read'):
+                    yield column_name, chunk[column_name]
+    
+    def collect_name_lookups(self, input_path: str, chunksize: int) -> Dict[str, List[Tuple[bool, int]]]:
+        name_handlers = self._name_handlers()
+        
+        lookups: Dict[str, dict] = {}
+        for column_name, values in self._name_column_chunks(input_path, self._csv_read_options(), chunksize):
+            handler = name_handlers[column_name]
+            _, uniques = _factorize(values)
+            lookups.setdefault(column_name, {}).update(dict.fromkeys(handler.name_lookups(handler.prepare_many(uniques))))
+        return {column_name: list(column_lookups) for column_name, column_lookups in lookups.items()}
+    
+    def anonymize_excel(self, input_path: str, output_path: str, chunksize: Optional[int] = None) -> None:
+        if chunksize is not None:
+            with self._execution():
+                self._anonymize_excel_streaming(input_path, output_path, chunksize)
+            return
+        
+        with self._stage('read'):
+            excel_file = pd.ExcelFile(input_path)
+        dtype = self._column_dtypes()
+        
+        with self._execution():
+            writer = pd.ExcelWriter(output_path, engine='openpyxl')
+            try:
+                if self._pool is not None:
+                    self._anonymize_sheets_in_parallel(input_path, excel_file.sheet_names, writer)
+                    return
+                
+                for sheet_name in excel_file.sheet_names:
+                    with self._stage('read'):
+                        df = pd.read_excel(excel_file, sheet_name=sheet_name, dtype=dtype)
+                    self.anonymize_dataframe(df, inplace=True)
+                    with self._stage('write'):
+                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+            finally:
+                with self._stage('write'):
+                    writer.close()
+    
+    def _anonymize_sheets_in_parallel(self, input_path: str, sheet_names: List[str], writer: pd.ExcelWriter) -> None:
+        pending_sheets = iter(sheet_names)
+        futures = deque(
+            self._pool.submit(_prepare_sheet_in_worker, input_path, sheet_name)
+            for sheet_name in islice(pending_sheets, self.workers)
+        )
+        
+        for sheet_name in sheet_names:
+            with self._stage('workers'):
+                df, prepared_columns = futures.popleft().result()
+            for next_sheet in islice(pending_sheets, 1):
+                futures.append(self._pool.submit(_prepare_sheet_in_worker, input_path, next_sheet))
+            
+            for column_name, (codes, prepared) in prepared_columns.items():
+                anonymized = self._render_values(column_name, prepared)
+                df[column_name] = pd.Series(anonymized.take(codes), index=df.index, name=column_name)
+            
+            with self._stage('write'):
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+    
+    def _prepare_sheet(self, input_path: str, sheet_name: str) -> Tuple[pd.DataFrame, Dict[str, Tuple[np.ndarray, Sequence[Any]]]]:
+        dtype = self._column_dtypes()
+        df = pd.read_excel(input_path, sheet_name=sheet_name, dtype=dtype)
+        
+        prepared_columns = {}
         for column_name, handler in self.handlers.items():
-            if column_name in result_df.columns:
-                result_df[column_name] = result_df[column_name].apply(handler.anonymize)
+            if column_name in df.columns:
+                codes, uniques = _factorize(df[column_name])
+                prepared_columns[column_name] = (codes, uniques if _skips_prepare(handler) else handler.prepare_many(uniques))
         
-        return result_df
+        return df, prepared_columns
     
-    def anonymize_csv(self, input_path: str, output_path: str) -> None:
-        df = pd.read_csv(input_path)
-        anonymized_df = self.anonymize_dataframe(df)
-        anonymized_df.to_csv(output_path, index=False)
+    def _anonymize_excel_streaming(self, input_path: str, output_path: str, chunksize: int) -> None:
+        import openpyxl
+        
+        with self._stage('read'):
+            workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+        
+        try:
+            if not self.name_generator.deterministic:
+                self._assign_names_in_workbook_order(workbook, chunksize)
+            
+            output_workbook = openpyxl.Workbook(write_only=True)
+            
+            for worksheet in workbook.worksheets:
+                output_sheet = output_workbook.create_sheet(worksheet.title)
+                header, rows = self._read_sheet(worksheet)
+                if header is None:
+                    continue
+                
+                output_sheet.append(header)
+                positions = self._column_positions(header)
+                
+                while True:
+                    with self._stage('read'):
+                        batch = [list(row) for row in islice(rows, chunksize)]
+                    if not batch:
+                        break
+                    
+                    for column_name, position in positions.items():
+                        column = pd.Series([row[position] for row in batch], dtype=object)
+                        anonymized = self._anonymize_series(column_name, column)
+                        for row, value in zip(batch, anonymized):
+                            row[position] = value
+                    
+                    with self._stage('write'):
+                        for row in batch:
+                            output_sheet.append(row)
+            
+            with self._stage('write'):
+                output_workbook.save(output_path)
+        finally:
+            workbook.close()
+    
+    def _assign_names_in_workbook_order(self, workbook: Any, chunksize: int) -> None:
+        for worksheet in workbook.worksheets:
+            header, _ = self._read_sheet(worksheet)
+            if header is None:
+                continue
+            
+            positions = self._column_positions(header)
+            for column_name in self._name_handlers():
+                if column_name not in positions:
+                    continue
+                
+                position = positions[column_name]
+                _, rows = self._read_sheet(worksheet)
+                while True:
+                    with self._stage('read'):
+                        values = [row[position] for row in islice(rows, chunksize)]
+                    if not values:
+                        break
+                    self._prime_names(column_name, pd.Series(values, dtype=object))
+    
+    def _column_positions(self, header: Tuple[Any, ...]) -> Dict[str, int]:
+        positions: Dict[str, int] = {}
+        for position, column_name in enumerate(header):
+            if column_name in self.handlers and column_name not in positions:
+                positions[column_name] = position
+        return positions
+    
+    def _read_sheet(self, worksheet: Any) -> Tuple[Optional[Tuple[Any, ...]], Iterator[Tuple[Any, ...]]]:
+        rows = self._non_trailing_rows(worksheet)
+        header = next(rows, None)
+        if header is None:
+            return None, iter(())
+        
+        width = len(header)
+        return header, (tuple(row[:width]) + (None,) * (width - len(row)) for row in rows)
     
-    def anonymize_excel(self, input_path: str, output_path: str) -> None:
-        excel_file = pd.ExcelFile(input_path)
+    def _non_trailing_rows(self, worksheet: Any) -> Iterator[Tuple[Any, ...]]:
+        empty_rows = 0
         
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                anonymized_df = self.anonymize_dataframe(df)
-                anonymized_df.to_excel(writer, sheet_name=sheet_name, index=False)
+        for row in worksheet.iter_rows(values_only=True):
+            if all(cell is None for cell in row):
+                empty_rows += 1
+                continue
+            
+            for _ in range(empty_rows):
+                yield (None,) * len(row)
+            empty_rows = 0
+            yield row
+    
+    def anonymize_parquet(self, input_path: str, output_path: str, chunksize: Optional[int] = None) -> None:
+        pa, pq = import_pyarrow()
+        batch_size = chunksize or ARROW_BATCH_SIZE
+        
+        with self._execution(), pq.ParquetFile(input_path) as parquet_file:
+            schema = self._anonymized_schema(parquet_file.schema_arrow)
+            
+            if not self.name_generator.deterministic:
+                self._assign_names_in_batches(
+                    parquet_file.schema_arrow.names,
+                    lambda column_name: (
+                        batch.column(0)
+                        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=[column_name])
+                    )
+                )
+            
+            with pq.ParquetWriter(output_path, schema) as writer:
+                for batch in self._timed(parquet_file.iter_batches(batch_size=batch_size), 'read'):
+                    anonymized_batch = self._anonymize_record_batch(batch, schema)
+                    with self._stage('write'):
+                        writer.write_batch(anonymized_batch)
+    
+    def anonymize_arrow(self, input_path: str, output_path: str, chunksize: Optional[int] = None) -> None:
+        pa, _ = import_pyarrow()
+        
+        with self._execution(), pa.memory_map(input_path) as source:
+            reader = pa.ipc.open_file(source)
+            schema = self._anonymized_schema(reader.schema)
+            
+            def batches() -> Iterator[Any]:
+                for index in range(reader.num_record_batches):
+                    batch = reader.get_batch(index)
+                    step = chunksize or batch.num_rows or 1
+                    for offset in range(0, batch.num_rows, step):
+                        yield batch.slice(offset, step)
+            
+            if not self.name_generator.deterministic:
+                self._assign_names_in_batches(
+                    reader.schema.names,
+                    lambda column_name: (batch.column(column_name) for batch in batches())
+                )
+            
+            with pa.OSFile(output_path, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+                for batch in self._timed(batches(), 'read'):
+                    anonymized_batch = self._anonymize_record_batch(batch, schema)
+                    with self._stage('write'):
+                        writer.write_batch(anonymized_batch)
+    
+    def _anonymized_schema(self, schema: Any) -> Any:
+        pa, _ = import_pyarrow()
+        
+        for index, field in enumerate(schema):
+            if field.name in self.handlers:
+                schema = schema.set(index, pa.field(field.name, pa.string(), nullable=True))
+        
+        if schema.metadata and b'pandas' in schema.metadata:
+            pandas_metadata = json.loads(schema.metadata[b'pandas'])
+            for column in pandas_metadata.get('columns', []):
+                if column.get('field_name') in self.handlers:
+                    column.update(pandas_type='unicode', numpy_type='object', metadata=None)
+            schema = schema.with_metadata({**schema.metadata, b'pandas': json.dumps(pandas_metadata).encode('utf-8')})
+        return schema
+    
+    def _anonymize_record_batch(self, batch: Any, schema: Any) -> Any:
+        pa, _ = import_pyarrow()
+        
+        arrays = []
+        for field, array in zip(batch.schema, batch.columns):
+            if field.name in self.handlers:
+                anonymized = self._anonymize_series(field.name, array.to_pandas(integer_object_nulls=True))
+                array = pa.array(anonymized.to_numpy(dtype=object), type=pa.string())
+            arrays.append(array)
+        
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+    
+    def _assign_names_in_batches(self, column_names: Sequence[str], column_arrays: Callable[[str], Iterable[Any]]) -> None:
+        for column_name in self._name_handlers():
+            if column_name in column_names:
+                for array in self._timed(column_arrays(column_name), 'read'):
+                    self._prime_names(column_name, array.to_pandas(integer_object_nulls=True))
+    
+    def export_mapping(self, path: str) -> None:
+        MappingTable.write(path, bytes.fromhex(self.fingerprint), self.name_generator.export_entries())
+    
+    def load_mapping(self, path: str) -> None:
+        mapping = MappingTable(path)
+        if mapping.fingerprint != bytes.fromhex(self.fingerprint):
+            mapping.close()
+            raise ValueError(f"{path} was produced with a different salt, locale or name mode")
+        
+        if self.name_generator.mapping is not None:
+            self.name_generator.mapping.close()
+        self.name_generator.use_mapping(mapping)
+    
+    def close(self) -> None:
+        if self.name_generator.mapping is not None:
+            self.name_generator.mapping.close()
+            self.name_generator.mapping = None
+        self.name_generator.close()
+        if self.vault is not None:
+            self.vault.close()
     
     def get_salt(self) -> bytes:
         return self.hasher.get_salt()
@@ -1,9 +1,13 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
 from anonymization.utils.hasher import DeterministicHasher
 from anonymization.utils.normalizer import StringNormalizer, IdNormalizer
 from anonymization.utils.name_generator import NameGenerator
 
 
+ID_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
 class BaseColumnHandler:
     
     def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer):
@@ -12,148 +16,352 @@ class BaseColumnHandler:
     
     def anonymize(self, value: Any) -> Any:
         raise NotImplementedError
+    
+    def prepare(self, value: Any) -> Any:
+        return value
+    
+    def prepare_many(self, values: Sequence[Any]) -> List[Any]:
+        return [self.prepare(value) for value in values]
+    
+    def render(self, prepared: Any) -> Any:
+        return self.anonymize(prepared)
+    
+    def render_many(self, prepared: Sequence[Any]) -> List[Any]:
+        return [self.render(item) for item in prepared]
+    
+    def anonymize_batch(self, values: Sequence[Any]) -> Sequence[Any]:
+        if self.overrides_anonymize():
+            return [self.anonymize(value) for value in values]
+        return self.render_many(self.prepare_many(values))
+    
+    @classmethod
+    def overrides_anonymize(cls) -> bool:
+        builtin = next(klass for klass in cls.__mro__ if klass.__module__ == __name__)
+        return cls.anonymize is not builtin.anonymize
 
 
-class FirstNameHandler(BaseColumnHandler):
+class NormalizingColumnHandler(BaseColumnHandler):
+    
+    def prepare(self, value: Any) -> Any:
+        return self.prepare_normalized(self.normalizer.normalize(value))
+    
+    def prepare_many(self, values: Sequence[Any]) -> List[Any]:
+        return [self.prepare_normalized(normalized) for normalized in self.normalizer.normalize_many(values)]
+    
+    def prepare_normalized(self, normalized: str) -> Any:
+        raise NotImplementedError
+
+
+class NameTokenHandler(NormalizingColumnHandler):
     
     def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer, name_generator: NameGenerator):
         super().__init__(hasher, normalizer)
         self.name_generator = name_generator
     
     def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
-        if not normalized:
-            return ""
-        
-        hash_int = self.hasher.hash_to_int(normalized)
-        return self.name_generator.get_first_name(hash_int)
+        return self.render(self.prepare(value))
+    
+    def prepare_many(self, values: Sequence[Any]) -> List[Tuple[int, ...]]:
+        token_lists = [normalized.split() for normalized in self.normalizer.normalize_many(values)]
+        hashes = self.hash_tokens(token for tokens in token_lists for token in tokens)
+        return [tuple(map(hashes.__getitem__, tokens)) for tokens in token_lists]
+    
+    def hash_tokens(self, tokens: Iterable[str]) -> Dict[str, int]:
+        return {token: self.hasher.hash_to_int(token) for token in dict.fromkeys(tokens)}
+    
+    def generate_names(self, lookups: Iterable[Tuple[bool, int]]) -> Tuple[Dict[int, str], Dict[int, str]]:
+        first_names: Dict[int, str] = {}
+        last_names: Dict[int, str] = {}
+        for is_last, hash_int in lookups:
+            if is_last:
+                if hash_int not in last_names:
+                    last_names[hash_int] = self.name_generator.get_last_name(hash_int)
+            elif hash_int not in first_names:
+                first_names[hash_int] = self.name_generator.get_first_name(hash_int)
+        return first_names, last_names
 
 
-class LastNameHandler(BaseColumnHandler):
+class FirstNameHandler(NormalizingColumnHandler):
     
     def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer, name_generator: NameGenerator):
         super().__init__(hasher, normalizer)
         self.name_generator = name_generator
     
     def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
+        return self.render(self.prepare(value))
+    
+    def prepare_normalized(self, normalized: str) -> Optional[int]:
         if not normalized:
+            return None
+        
+        return self.hasher.hash_to_int(normalized)
+    
+    def render(self, prepared: Optional[int]) -> str:
+        if prepared is None:
             return ""
         
-        hash_int = self.hasher.hash_to_int(normalized)
-        return self.name_generator.get_last_name(hash_int)
+        return self.name_generator.get_first_name(prepared)
+    
+    def name_lookups(self, prepared: Sequence[Optional[int]]) -> List[Tuple[bool, int]]:
+        return [(False, hash_int) for hash_int in prepared if hash_int is not None]
 
 
-class FullNameHandler(BaseColumnHandler):
+class LastNameHandler(NormalizingColumnHandler):
     
     def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer, name_generator: NameGenerator):
         super().__init__(hasher, normalizer)
         self.name_generator = name_generator
     
     def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
+        return self.render(self.prepare(value))
+    
+    def prepare_normalized(self, normalized: str) -> Optional[int]:
         if not normalized:
+            return None
+        
+        return self.hasher.hash_to_int(normalized)
+    
+    def render(self, prepared: Optional[int]) -> str:
+        if prepared is None:
             return ""
         
-        parts = normalized.split()
-        if len(parts) == 0:
+        return self.name_generator.get_last_name(prepared)
+    
+    def name_lookups(self, prepared: Sequence[Optional[int]]) -> List[Tuple[bool, int]]:
+        return [(True, hash_int) for hash_int in prepared if hash_int is not None]
+
+
+class FullNameHandler(NameTokenHandler):
+    
+    def prepare_normalized(self, normalized: str) -> Tuple[int, ...]:
+        if not normalized:
+            return ()
+        
+        return tuple(self.hasher.hash_to_int(part) for part in normalized.split())
+    
+    def render(self, prepared: Tuple[int, ...]) -> str:
+        if len(prepared) == 0:
             return ""
-        elif len(parts) == 1:
-            hash_int = self.hasher.hash_to_int(parts[0])
-            return self.name_generator.get_first_name(hash_int)
+        elif len(prepared) == 1:
+            return self.name_generator.get_first_name(prepared[0])
         else:
-            last_hash = self.hasher.hash_to_int(parts[-1])
-            last = self.name_generator.get_last_name(last_hash)
+            last = self.name_generator.get_last_name(prepared[-1])
             
             first_names = []
-            for part in parts[:-1]:
-                first_hash = self.hasher.hash_to_int(part)
+            for first_hash in prepared[:-1]:
                 first_names.append(self.name_generator.get_first_name(first_hash))
             
             return f"{' '.join(first_names)} {last}"
+    
+    def name_lookups(self, prepared: Sequence[Tuple[int, ...]]) -> List[Tuple[bool, int]]:
+        lookups = []
+        for hashes in prepared:
+            if len(hashes) == 1:
+                lookups.append((False, hashes[0]))
+            elif hashes:
+                lookups.append((True, hashes[-1]))
+                lookups += [(False, first_hash) for first_hash in hashes[:-1]]
+        return lookups
+    
+    def render_many(self, prepared: Sequence[Tuple[int, ...]]) -> List[str]:
+        first_names, last_names = self.generate_names(self.name_lookups(prepared))
+        first_name = first_names.__getitem__
+        
+        return [
+            "" if not hashes
+            else first_names[hashes[0]] if len(hashes) == 1
+            else f"{' '.join(map(first_name, hashes[:-1]))} {last_names[hashes[-1]]}"
+            for hashes in prepared
+        ]
 
 
-class FullNameInvertedHandler(BaseColumnHandler):
-    
-    def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer, name_generator: NameGenerator):
-        super().__init__(hasher, normalizer)
-        self.name_generator = name_generator
+class FullNameInvertedHandler(NameTokenHandler):
     
-    def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
+    def prepare_normalized(self, normalized: str) -> Tuple[int, ...]:
         if not normalized:
-            return ""
+            return ()
         
-        parts = normalized.split()
-        if len(parts) == 0:
+        return tuple(self.hasher.hash_to_int(part) for part in normalized.split())
+    
+    def render(self, prepared: Tuple[int, ...]) -> str:
+        if len(prepared) == 0:
             return ""
-        elif len(parts) == 1:
-            hash_int = self.hasher.hash_to_int(parts[0])
-            return self.name_generator.get_last_name(hash_int)
+        elif len(prepared) == 1:
+            return self.name_generator.get_last_name(prepared[0])
         else:
-            last_hash = self.hasher.hash_to_int(parts[0])
-            last = self.name_generator.get_last_name(last_hash)
+            last = self.name_generator.get_last_name(prepared[0])
             
             first_names = []
-            for part in parts[1:]:
-                first_hash = self.hasher.hash_to_int(part)
+            for first_hash in prepared[1:]:
                 first_names.append(self.name_generator.get_first_name(first_hash))
             
             return f"{last} {' '.join(first_names)}"
+    
+    def name_lookups(self, prepared: Sequence[Tuple[int, ...]]) -> List[Tuple[bool, int]]:
+        lookups = []
+        for hashes in prepared:
+            if hashes:
+                lookups.append((True, hashes[0]))
+                lookups += [(False, first_hash) for first_hash in hashes[1:]]
+        return lookups
+    
+    def render_many(self, prepared: Sequence[Tuple[int, ...]]) -> List[str]:
+        first_names, last_names = self.generate_names(self.name_lookups(prepared))
+        first_name = first_names.__getitem__
+        
+        return [
+            "" if not hashes
+            else last_names[hashes[0]] if len(hashes) == 1
+            else f"{last_names[hashes[0]]} {' '.join(map(first_name, hashes[1:]))}"
+            for hashes in prepared
+        ]
 
 
-class EmailHandler(BaseColumnHandler):
+class EmailHandler(NameTokenHandler):
     
-    def __init__(self, hasher: DeterministicHasher, normalizer: StringNormalizer, name_generator: NameGenerator):
-        super().__init__(hasher, normalizer)
-        self.name_generator = name_generator
-    
-    def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
+    @staticmethod
+    def split_address(normalized: str) -> Optional[Tuple[str, str, Optional[str]]]:
         if not normalized or '@' not in normalized:
-            return ""
+            return None
         
         local_part, domain = normalized.split('@', 1)
         
         parts = local_part.split('.')
         
         if len(parts) == 0 or (len(parts) == 1 and not parts[0]):
-            return ""
+            return None
         elif len(parts) == 1:
-            hash_int = self.hasher.hash_to_int(parts[0])
-            first = self.name_generator.get_first_name(hash_int)
+            return domain, parts[0], None
+        else:
+            return domain, parts[0], parts[-1]
+    
+    def prepare_normalized(self, normalized: str) -> Optional[Tuple[str, int, Optional[int]]]:
+        address = self.split_address(normalized)
+        if address is None:
+            return None
+        
+        domain, first, last = address
+        return domain, self.hasher.hash_to_int(first), None if last is None else self.hasher.hash_to_int(last)
+    
+    def prepare_many(self, values: Sequence[Any]) -> List[Optional[Tuple[str, int, Optional[int]]]]:
+        addresses = [self.split_address(normalized) for normalized in self.normalizer.normalize_many(values)]
+        hashes = self.hash_tokens(
+            token
+            for address in addresses if address is not None
+            for token in address[1:] if token is not None
+        )
+        
+        return [
+            None if address is None
+            else (address[0], hashes[address[1]], None if address[2] is None else hashes[address[2]])
+            for address in addresses
+        ]
+    
+    def render(self, prepared: Optional[Tuple[str, int, Optional[int]]]) -> str:
+        if prepared is None:
+            return ""
+        
+        domain, first_hash, last_hash = prepared
+        first = self.name_generator.get_first_name(first_hash)
+        
+        if last_hash is None:
             email = f"{first.lower()}@{domain}"
         else:
-            first_hash = self.hasher.hash_to_int(parts[0])
-            last_hash = self.hasher.hash_to_int(parts[-1])
-            first = self.name_generator.get_first_name(first_hash)
             last = self.name_generator.get_last_name(last_hash)
             email = f"{first.lower()}.{last.lower()}@{domain}"
         
         return email
+    
+    def name_lookups(self, prepared: Sequence[Optional[Tuple[str, int, Optional[int]]]]) -> List[Tuple[bool, int]]:
+        lookups = []
+        for address in prepared:
+            if address is not None:
+                lookups.append((False, address[1]))
+                if address[2] is not None:
+                    lookups.append((True, address[2]))
+        return lookups
+    
+    def render_many(self, prepared: Sequence[Optional[Tuple[str, int, Optional[int]]]]) -> List[str]:
+        first_names, last_names = self.generate_names(self.name_lookups(prepared))
+        first_names = {hash_int: name.lower() for hash_int, name in first_names.items()}
+        last_names = {hash_int: name.lower() for hash_int, name in last_names.items()}
+        
+        return [
+            "" if address is None
+            else f"{first_names[address[1]]}@{address[0]}" if address[2] is None
+            else f"{first_names[address[1]]}.{last_names[address[2]]}@{address[0]}"
+            for address in prepared
+        ]
 
 
-class IdHandler(BaseColumnHandler):
+class IdHandler(NormalizingColumnHandler):
     
-    def __init__(self, hasher: DeterministicHasher, normalizer: IdNormalizer):
+    def __init__(self,
+                 hasher: DeterministicHasher,
+                 normalizer: IdNormalizer,
+                 length: int = 8,
+                 alphabet: str = ID_ALPHABET):
         super().__init__(hasher, normalizer)
+        if not 2 <= len(alphabet) <= 1 << 16 or len(set(alphabet)) != len(alphabet):
+            raise ValueError("ID alphabet needs 2 to 65536 distinct characters")
+        if length < 1:
+            raise ValueError(f"ID length must be at least 1, got {length}")
+        self.length = length
+        self.alphabet = alphabet
     
     def anonymize(self, value: Any) -> str:
-        normalized = self.normalizer.normalize(value)
+        return self.prepare(value)
+    
+    def prepare_normalized(self, normalized: str) -> str:
         if not normalized:
             return ""
         
         hash_int = self.hasher.hash_to_int(normalized)
         
-        chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        chars = self.alphabet
         base = len(chars)
         result = []
         
-        for _ in range(8):
+        for _ in range(self.length):
             result.append(chars[hash_int % base])
             hash_int //= base
         
         return ''.join(result)
+    
+    def prepare_many(self, values: Sequence[Any]) -> List[str]:
+        normalized = self.normalizer.normalize_many(values)
+        present = [index for index, text in enumerate(normalized) if text]
+        
+        result = [""] * len(normalized)
+        if present:
+            digests = self.hasher.hash_many([normalized[index] for index in present], bits=256)
+            for index, encoded in zip(present, self.encode_digests(digests)):
+                result[index] = encoded
+        return result
+    
+    def encode_digests(self, digests: np.ndarray) -> List[str]:
+        base = len(self.alphabet)
+        limbs = digests.astype('>u8').view('>u2').astype(np.uint64)
+        digits = np.empty((len(limbs), self.length), dtype=np.uint64)
+        
+        group = 1
+        while base ** (group + 1) <= 1 << 48:
+            group += 1
+        
+        for start in range(0, self.length, group):
+            count = min(group, self.length - start)
+            divisor = np.uint64(base ** count)
+            remainder = np.zeros(len(limbs), dtype=np.uint64)
+            for limb in range(limbs.shape[1]):
+                limbs[:, limb], remainder = np.divmod((remainder << np.uint64(16)) | limbs[:, limb], divisor)
+            for position in range(start, start + count):
+                remainder, digits[:, position] = np.divmod(remainder, np.uint64(base))
+        
+        table = np.array(list(self.alphabet), dtype='U1')
+        return np.ascontiguousarray(table[digits]).view(f'U{self.length}').ravel().tolist()
+    
+    def render(self, prepared: str) -> str:
+        return prepared
 
 
 class MiscHandler(BaseColumnHandler):
@@ -163,4 +371,9 @@ class MiscHandler(BaseColumnHandler):
     
     def anonymize(self, value: Any) -> str:
         return ""
-
+    
+    def prepare(self, value: Any) -> None:
+        return None
+    
+    def render(self, prepared: None) -> str:
+        return ""
@@ -0,0 +1,103 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class _TimedProxy:
+    
+    def __init__(self, target: Any, profiler: 'AnonymizationProfiler', stage: str, methods: Iterable[str]):
+        self._target = target
+        self._profiler = profiler
+        self._stage = stage
+        self._methods = set(methods)
+    
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name not in self._methods:
+            return attribute
+        
+        profiler = self._profiler
+        stage = self._stage
+        
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                profiler.record(stage, time.perf_counter() - start)
+        
+        setattr(self, name, timed)
+        return timed
+
+
+class AnonymizationProfiler:
+    
+    def __init__(self):
+        self.current_column: Optional[str] = None
+        self.timings: Dict[Tuple[str, Optional[str]], List[float]] = {}
+        self.counters: Dict[str, int] = {}
+    
+    def record(self, stage: str, seconds: float, column: Optional[str] = None, calls: int = 1) -> None:
+        key = (stage, column if column is not None else self.current_column)
+        entry = self.timings.setdefault(key, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+    
+    @contextmanager
+    def stage(self, stage: str, column: Optional[str] = None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, column=column)
+    
+    @contextmanager
+    def column(self, column_name: str) -> Iterator[None]:
+        previous = self.current_column
+        self.current_column = column_name
+        try:
+            yield
+        finally:
+            self.current_column = previous
+    
+    def instrument(self, target: Any, stage: str, methods: Iterable[str]) -> Any:
+        return _TimedProxy(target, self, stage, methods)
+    
+    def update_counters(self, counters: Dict[str, int]) -> None:
+        self.counters.update(counters)
+    
+    def report(self) -> Dict[str, Any]:
+        stages = [
+            {'stage': stage, 'column': column, 'seconds': seconds, 'calls': calls}
+            for (stage, column), (seconds, calls) in self.timings.items()
+        ]
+        
+        counters: Dict[str, Any] = dict(self.counters)
+        for kind in ('first_name', 'last_name', 'hash'):
+            hits = self.counters.get(f"{kind}_cache_hits", 0)
+            misses = self.counters.get(f"{kind}_cache_misses", 0)
+            if hits + misses:
+                counters[f"{kind}_cache_hit_rate"] = hits / (hits + misses)
+        
+        return {'stages': stages, 'counters': counters}
+    
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2)
+    
+    def format_table(self) -> str:
+        report = self.report()
+        lines = [f"  {'Stage':<18} {'Column':<24} {'Calls':>10} {'Seconds':>10}"]
+        lines.append('  ' + '─' * 65)
+        
+        for entry in sorted(report['stages'], key=lambda item: -item['seconds']):
+            column = (entry['column'] or '-')[:24]
+            lines.append(f"  {entry['stage']:<18} {column:<24} {entry['calls']:>10} {entry['seconds']:>10.3f}")
+        
+        if report['counters']:
+            lines.append('')
+            for name, value in report['counters'].items():
+                display = f"{value:.1%}" if isinstance(value, float) else str(value)
+                lines.append(f"  {name:<44} {display:>10}")
+        
+        return '\n'.join(lines)
@@ -0,0 +1,163 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from anonymization.core.anonymizer import Anonymizer
+from anonymization.cli.file_handlers import get_file_handler
+from anonymization.utils.pseudonym_vault import PseudonymVault
+
+
+SCAN_FORMAT_VERSION = 1
+
+SCAN_CHUNKSIZE = 100_000
+
+DIGEST_HEX_LENGTH = 64
+
+
+class ShardedAnonymizer:
+    
+    def __init__(self,
+                 column_config: Dict[str, str],
+                 salt: bytes,
+                 locale: str = 'en_US',
+                 deterministic_names: bool = False,
+                 chunksize: Optional[int] = None,
+                 anonymizer_options: Optional[Dict[str, Any]] = None):
+        self.column_config = column_config
+        self.salt = salt
+        self.locale = locale
+        self.deterministic_names = deterministic_names
+        self.chunksize = chunksize
+        self.anonymizer_options = anonymizer_options or {}
+        self.fingerprint = PseudonymVault.fingerprint_for(salt, locale, deterministic_names)
+    
+    def create_anonymizer(self, **options: Any) -> Anonymizer:
+        return Anonymizer(
+            column_config=self.column_config,
+            salt=self.salt,
+            locale=self.locale,
+            deterministic_names=self.deterministic_names,
+            **{**self.anonymizer_options, **options}
+        )
+    
+    def scan(self, input_path: str, scan_path: str) -> None:
+        if Path(input_path).suffix.lower() != '.csv':
+            raise ValueError(f"Sharded scans support CSV shards only: {input_path}")
+        
+        anonymizer = self.create_anonymizer()
+        try:
+            lookups = anonymizer.collect_name_lookups(input_path, self.chunksize or SCAN_CHUNKSIZE)
+        finally:
+            anonymizer.close()
+        
+        columns = {
+            column_name: {
+                'kinds': ''.join('L' if is_last else 'F' for is_last, _ in column_lookups),
+                'digests': ''.join(f"{hash_int:064x}" for _, hash_int in column_lookups)
+            }
+            for column_name, column_lookups in lookups.items()
+        }
+        self._write_json(scan_path, {
+            'version': SCAN_FORMAT_VERSION,
+            'fingerprint': self.fingerprint,
+            'column_config': self.column_config,
+            'columns': columns
+        })
+    
+    def merge(self, scan_paths: Sequence[str], mapping_path: str) -> None:
+        scans = [self._read_json(scan_path, SCAN_FORMAT_VERSION) for scan_path in scan_paths]
+        
+        lookups: Dict[Tuple[bool, int], None] = {}
+        for column_name in self.column_config:
+            for scan in scans:
+                if column_name in scan['columns']:
+                    lookups.update(dict.fromkeys(self._parse_lookups(scan['columns'][column_name])))
+        
+        anonymizer = self.create_anonymizer()
+        try:
+            for is_last, hash_int in lookups:
+                if is_last:
+                    anonymizer.name_generator.get_last_name(hash_int)
+                else:
+                    anonymizer.name_generator.get_first_name(hash_int)
+            anonymizer.export_mapping(mapping_path)
+        finally:
+            anonymizer.close()
+    
+    def apply(self, input_path: str, output_path: str, mapping_path: str) -> None:
+        _check_outputs([input_path], [output_path])
+        anonymizer = self.create_anonymizer()
+        try:
+            anonymizer.load_mapping(mapping_path)
+            get_file_handler(input_path).anonymize(anonymizer, output_path, chunksize=self.chunksize)
+        finally:
+            anonymizer.close()
+    
+    @staticmethod
+    def _parse_lookups(column: Dict[str, str]) -> List[Tuple[bool, int]]:
+        digests = column['digests']
+        return [
+            (kind == 'L', int(digests[index * DIGEST_HEX_LENGTH:(index + 1) * DIGEST_HEX_LENGTH], 16))
+            for index, kind in enumerate(column['kinds'])
+        ]
+    
+    @staticmethod
+    def _write_json(path: str, payload: Dict[str, Any]) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(payload, file, ensure_ascii=False)
+    
+    def _read_json(self, path: str, version: int) -> Dict[str, Any]:
+        with open(path, encoding='utf-8') as file:
+            payload = json.load(file)
+        
+        if payload.get('version') != version:
+            raise ValueError(f"Unsupported format version in {path}")
+        if payload.get('fingerprint') != self.fingerprint:
+            raise ValueError(f"{path} was produced with a different salt, locale or name mode")
+        if payload.get('column_config') != self.column_config:
+            raise ValueError(f"{path} was produced with a different column configuration")
+        return payload
+
+
+def _check_outputs(input_paths: Sequence[str], output_paths: Sequence[str]) -> None:
+    inputs = {Path(input_path).resolve() for input_path in input_paths}
+    for output_path in output_paths:
+        if Path(output_path).resolve() in inputs:
+            raise ValueError(f"Output would overwrite an input shard: {output_path}")
+
+
+def _scan_shard(sharded: ShardedAnonymizer, input_path: str, scan_path: str) -> None:
+    sharded.scan(input_path, scan_path)
+
+
+def _apply_shard(sharded: ShardedAnonymizer, input_path: str, output_path: str, mapping_path: str) -> None:
+    sharded.apply(input_path, output_path, mapping_path)
+
+
+class LocalShardRunner:
+    
+    def __init__(self, sharded: ShardedAnonymizer, workers: int = 1):
+        self.sharded = sharded
+        self.workers = workers
+    
+    def run(self, input_paths: Sequence[str], output_dir: str, work_dir: Optional[str] = None) -> str:
+        output = Path(output_dir)
+        work = Path(work_dir) if work_dir is not None else output / '.shards'
+        
+        output_paths = [str(output / Path(input_path).name) for input_path in input_paths]
+        if len(set(output_paths)) != len(output_paths):
+            raise ValueError("Shard file names must be unique")
+        _check_outputs(input_paths, output_paths)
+        
+        output.mkdir(parents=True, exist_ok=True)
+        work.mkdir(parents=True, exist_ok=True)
+        scan_paths = [str(work / f"shard-{index:05d}.scan.json") for index in range(len(input_paths))]
+        mapping_path = str(work / 'mapping.ncmap')
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(_scan_shard, repeat(self.sharded), input_paths, scan_paths))
+            self.sharded.merge(scan_paths, mapping_path)
+            list(pool.map(_apply_shard, repeat(self.sharded), input_paths, output_paths, repeat(mapping_path)))
+        
+        return mapping_path
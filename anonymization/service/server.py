@@ -0,0 +1,262 @@
+import asyncio
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import pandas as pd
+from anonymization.core.anonymizer import Anonymizer
+from anonymization.cli.file_handlers import get_file_handler
+
+
+MAX_BODY_BYTES = 256 * 1024 * 1024
+
+
+class RequestError(Exception):
+    
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class AnonymizerRegistry:
+    
+    def __init__(self, max_anonymizers: int = 16, anonymizer_options: Optional[Dict[str, Any]] = None):
+        self.max_anonymizers = max_anonymizers
+        self.anonymizer_options = anonymizer_options or {}
+        self._entries: 'OrderedDict[Tuple[Any, ...], Tuple[Anonymizer, asyncio.Lock]]' = OrderedDict()
+    
+    @staticmethod
+    def key_for(settings: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            settings['salt'],
+            settings['locale'],
+            settings['deterministic_names'],
+            tuple(sorted(settings['columns'].items()))
+        )
+    
+    def get(self, settings: Dict[str, Any]) -> Tuple[Anonymizer, asyncio.Lock]:
+        key = self.key_for(settings)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        
+        anonymizer = Anonymizer(
+            column_config=settings['columns'],
+            salt=bytes.fromhex(settings['salt']),
+            locale=settings['locale'],
+            deterministic_names=settings['deterministic_names'],
+            **self.anonymizer_options
+        )
+        self._entries[key] = (anonymizer, asyncio.Lock())
+        self._evict()
+        return self._entries[key]
+    
+    def _evict(self) -> None:
+        for key in list(self._entries)[:-1]:
+            if len(self._entries) <= self.max_anonymizers:
+                return
+            anonymizer, lock = self._entries[key]
+            if not lock.locked():
+                del self._entries[key]
+                anonymizer.close()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def close(self) -> None:
+        for anonymizer, _ in self._entries.values():
+            anonymizer.close()
+        self._entries.clear()
+
+
+class AnonymizationServer:
+    
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 8765,
+                 socket_path: Optional[str] = None,
+                 concurrency: int = 4,
+                 max_pending: int = 64,
+                 max_anonymizers: int = 16,
+                 anonymizer_options: Optional[Dict[str, Any]] = None,
+                 data_dir: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.registry = AnonymizerRegistry(max_anonymizers, anonymizer_options)
+        self.data_dir = Path(data_dir).resolve() if data_dir is not None else None
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def start(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='anonymize')
+        self._slots = asyncio.Semaphore(self.concurrency)
+        
+        if self.socket_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+    
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.registry.close()
+    
+    @property
+    def address(self) -> str:
+        if self.socket_path is not None:
+            return f"unix:{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        
+        method, path, _ = request_line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_BYTES:
+            raise ConnectionError("Request body too large")
+        body = await reader.readexactly(length) if length else b''
+        return method, path, headers, body
+    
+    def _write_response(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload: str, keep_alive: bool) -> None:
+        body = payload.encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+    
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, str]:
+        try:
+            if path == '/health':
+                return HTTPStatus.OK, json.dumps({
+                    'status': 'ok',
+                    'anonymizers': len(self.registry),
+                    'pending': self.pending
+                })
+            if path != '/anonymize':
+                raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+            if method != 'POST':
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+            if self.pending >= self.max_pending:
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Server is busy, retry later")
+            
+            self.pending += 1
+            try:
+                return HTTPStatus.OK, await self._anonymize(self._parse_request(body))
+            finally:
+                self.pending -= 1
+        except RequestError as error:
+            return error.status, json.dumps({'error': str(error)})
+        except (ValueError, KeyError, FileNotFoundError) as error:
+            return HTTPStatus.BAD_REQUEST, json.dumps({'error': str(error)})
+        except Exception as error:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({'error': str(error)})
+    
+    def _parse_request(self, body: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(body or b'{}')
+        except json.JSONDecodeError as error:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {error}") from error
+        
+        if not isinstance(request, dict) or not isinstance(request.get('columns'), dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'columns' must map column names to types")
+        if not isinstance(request.get('salt'), str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'salt' (hex) is required")
+        if ('rows' in request) == ('input_path' in request):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Provide either 'rows' or 'input_path' and 'output_path'")
+        
+        if 'input_path' in request:
+            input_path = self._resolve_data_path(request['input_path'])
+            output_path = self._resolve_data_path(request.get('output_path'))
+            if input_path == output_path:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "'output_path' must differ from 'input_path'")
+            request['input_path'], request['output_path'] = str(input_path), str(output_path)
+        
+        request.setdefault('locale', 'en_US')
+        request.setdefault('deterministic_names', False)
+        return request
+    
+    def _resolve_data_path(self, path: Any) -> Path:
+        if self.data_dir is None:
+            raise RequestError(HTTPStatus.FORBIDDEN, "File requests are disabled; start the server with --data-dir")
+        if not isinstance(path, str) or not path:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'input_path' and 'output_path' must be non-empty strings")
+        
+        resolved = (self.data_dir / path).resolve()
+        if not resolved.is_relative_to(self.data_dir):
+            raise RequestError(HTTPStatus.FORBIDDEN, f"Path is outside the data directory: {path}")
+        return resolved
+    
+    async def _anonymize(self, request: Dict[str, Any]) -> str:
+        anonymizer, lock = self.registry.get(request)
+        loop = asyncio.get_running_loop()
+        
+        async with lock, self._slots:
+            if 'rows' in request:
+                return await loop.run_in_executor(self._executor, self._anonymize_rows, anonymizer, request['rows'])
+            return await loop.run_in_executor(
+                self._executor, self._anonymize_file, anonymizer,
+                request['input_path'], request['output_path'], request.get('chunksize')
+            )
+    
+    @staticmethod
+    def _anonymize_rows(anonymizer: Anonymizer, rows: Any) -> str:
+        df = pd.DataFrame(rows, dtype=object)
+        anonymizer.anonymize_dataframe(df, inplace=True)
+        return f'{{"rows": {df.to_json(orient="records", force_ascii=False)}}}'
+    
+    @staticmethod
+    def _anonymize_file(anonymizer: Anonymizer, input_path: str, output_path: str, chunksize: Optional[int]) -> str:
+        get_file_handler(input_path).anonymize(anonymizer, output_path, chunksize=chunksize)
+        return json.dumps({'output_path': output_path})
@@ -0,0 +1,12 @@
+from typing import Any, Tuple
+
+
+def import_pyarrow() -> Tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Parquet and Arrow support requires pyarrow: pip install 'namechameleon[arrow]'"
+        ) from error
+    return pyarrow, pyarrow.parquet
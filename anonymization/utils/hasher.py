@@ -1,26 +1,85 @@
-import hmac
 import hashlib
 import secrets
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+DEFAULT_HASH_CACHE_SIZE = 262_144
 
 
 class DeterministicHasher:
     
-    def __init__(self, salt: Optional[bytes] = None):
+    def __init__(self, salt: Optional[bytes] = None, cache_size: int = DEFAULT_HASH_CACHE_SIZE):
         if salt is None:
             self.salt = secrets.token_bytes(32)
         else:
             self.salt = salt
+        
+        self._inner, self._outer = self._keyed_pads(self.salt)
+        
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, int]' = OrderedDict()
+        self.stats: Dict[str, int] = {'hash_cache_hits': 0, 'hash_cache_misses': 0}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_inner'], state['_outer'], state['_cache']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._inner, self._outer = self._keyed_pads(self.salt)
+        self._cache = OrderedDict()
+    
+    @staticmethod
+    def _keyed_pads(key: bytes) -> Tuple[Any, Any]:
+        block_size = hashlib.sha256().block_size
+        if len(key) > block_size:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(block_size, b'\0')
+        
+        inner = hashlib.sha256(bytes(byte ^ 0x36 for byte in key))
+        outer = hashlib.sha256(bytes(byte ^ 0x5C for byte in key))
+        return inner, outer
+    
+    def digest(self, value: str) -> bytes:
+        inner = self._inner.copy()
+        inner.update(value.encode('utf-8'))
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
     
     def hash_to_int(self, value: str) -> int:
-        digest = hmac.new(
-            self.salt,
-            value.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
+        if self.cache_size <= 0:
+            return int.from_bytes(self.digest(value), byteorder='big')
         
-        return int.from_bytes(digest, byteorder='big')
+        cache = self._cache
+        hash_int = cache.get(value)
+        if hash_int is not None:
+            cache.move_to_end(value)
+            self.stats['hash_cache_hits'] += 1
+            return hash_int
+        
+        self.stats['hash_cache_misses'] += 1
+        hash_int = int.from_bytes(self.digest(value), byteorder='big')
+        cache[value] = hash_int
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return hash_int
+    
+    def hash_many(self, values: Iterable[str], bits: int = 64) -> 'np.ndarray':
+        import numpy as np
+        
+        if bits not in (64, 128, 256):
+            raise ValueError(f"Unsupported digest width: {bits}")
+        
+        width = bits // 8
+        digests = b''.join(self.digest(value)[:width] for value in values)
+        words = np.frombuffer(digests, dtype='>u8').astype(np.uint64)
+        return words.reshape(-1, bits // 64)
     
     def get_salt(self) -> bytes:
         return self.salt
-
@@ -0,0 +1,151 @@
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from anonymization.utils.name_cache import KEY_MASK
+
+
+MAGIC = b'CHAMMAP\0'
+
+FORMAT_VERSION = 1
+
+NAME_KINDS = ('first_name', 'last_name')
+
+HEADER = struct.Struct('<8sII16s')
+
+SECTION = struct.Struct('<16sQQQ')
+
+DIGEST_WIDTH = 16
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // 8) * 8
+
+
+class MappingTable:
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map: Optional[mmap.mmap] = None
+        self._sections: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        
+        try:
+            if os.fstat(self._file.fileno()).st_size < HEADER.size:
+                raise ValueError(f"Not a mapping table: {path}")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            layout = self._read_layout()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+        
+        for kind, count, digests_offset, offsets_offset in layout:
+            digests = np.frombuffer(self._map, dtype=f'S{DIGEST_WIDTH}', count=count, offset=digests_offset)
+            offsets = np.frombuffer(self._map, dtype='<u8', count=count + 1, offset=offsets_offset)
+            self._sections[kind] = (digests, offsets, offsets_offset + offsets.nbytes)
+    
+    def _read_layout(self) -> List[Tuple[str, int, int, int]]:
+        magic, version, kind_count, self.fingerprint = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a mapping table: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported mapping table version {version}: {self.path}")
+        
+        layout = []
+        if HEADER.size + kind_count * SECTION.size > len(self._map):
+            raise ValueError(f"Truncated mapping table: {self.path}")
+        
+        for index in range(kind_count):
+            kind, count, digests_offset, offsets_offset = SECTION.unpack_from(self._map, HEADER.size + index * SECTION.size)
+            blob_offset = offsets_offset + (count + 1) * 8
+            if (digests_offset + count * DIGEST_WIDTH > offsets_offset
+                    or blob_offset > len(self._map)
+                    or blob_offset + struct.unpack_from('<Q', self._map, blob_offset - 8)[0] > len(self._map)):
+                raise ValueError(f"Truncated mapping table: {self.path}")
+            layout.append((kind.rstrip(b'\0').decode('ascii'), count, digests_offset, offsets_offset))
+        return layout
+    
+    @staticmethod
+    def write(path: str, fingerprint: bytes, entries: Dict[str, Iterable[Tuple[bytes, str]]]) -> None:
+        sections = []
+        for kind in NAME_KINDS:
+            items = sorted(dict(entries.get(kind, ())).items())
+            names = [name.encode('utf-8') for _, name in items]
+            offsets = np.zeros(len(items) + 1, dtype='<u8')
+            np.cumsum([len(name) for name in names], out=offsets[1:])
+            sections.append((kind, b''.join(key for key, _ in items), offsets, b''.join(names)))
+        
+        position = HEADER.size + SECTION.size * len(sections)
+        directory = []
+        for kind, digests, offsets, _ in sections:
+            digests_offset = _aligned(position)
+            offsets_offset = _aligned(digests_offset + len(digests))
+            position = offsets_offset + offsets.nbytes + int(offsets[-1])
+            directory.append(SECTION.pack(kind.encode('ascii'), len(digests) // DIGEST_WIDTH, digests_offset, offsets_offset))
+        
+        # Write beside the target and swap it in, so a table mapped from the same path stays valid
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), fingerprint))
+            file.write(b''.join(directory))
+            for (kind, digests, offsets, blob), section in zip(sections, directory):
+                _, _, digests_offset, offsets_offset = SECTION.unpack(section)
+                file.write(b'\0' * (digests_offset - file.tell()))
+                file.write(digests)
+                file.write(b'\0' * (offsets_offset - file.tell()))
+                file.write(offsets.tobytes())
+                file.write(blob)
+        os.replace(temporary_path, path)
+    
+    def __len__(self) -> int:
+        return sum(len(digests) for digests, _, _ in self._sections.values())
+    
+    def get(self, kind: str, hash_int: int) -> Optional[str]:
+        section = self._sections.get(kind)
+        if section is None:
+            return None
+        
+        digests, offsets, blob_offset = section
+        key = (hash_int & KEY_MASK).to_bytes(DIGEST_WIDTH, byteorder='big')
+        index = int(np.searchsorted(digests, key))
+        # NumPy drops trailing NUL bytes from fixed-width bytes, on both sides of the comparison
+        if index == len(digests) or digests[index] != key.rstrip(b'\0'):
+            return None
+        
+        start = blob_offset + int(offsets[index])
+        end = blob_offset + int(offsets[index + 1])
+        return self._map[start:end].decode('utf-8')
+    
+    def items(self, kind: str) -> Iterator[Tuple[bytes, str]]:
+        if kind not in self._sections:
+            return iter(())
+        
+        digests, _, _ = self._sections[kind]
+        return zip((digest.ljust(DIGEST_WIDTH, b'\0') for digest in digests.tolist()), self.names(kind))
+    
+    def names(self, kind: str) -> List[str]:
+        if kind not in self._sections:
+            return []
+        
+        _, offsets, blob_offset = self._sections[kind]
+        blob = self._map[blob_offset:blob_offset + int(offsets[-1])].decode('utf-8')
+        bounds = offsets.tolist()
+        
+        if blob.isascii():
+            return [blob[start:end] for start, end in zip(bounds, bounds[1:])]
+        raw = self._map[blob_offset:blob_offset + bounds[-1]]
+        return [raw[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+    
+    def close(self) -> None:
+        self._sections = {}
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+    
+    def __enter__(self) -> 'MappingTable':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,59 @@
+import sqlite3
+from typing import Dict, Iterator, Optional, Tuple
+
+
+KEY_MASK = (1 << 128) - 1
+
+
+class NameCache:
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self.spills = 0
+        self._entries: Dict[bytes, str] = {}
+        self._spill: Optional[sqlite3.Connection] = None
+    
+    @staticmethod
+    def _key(hash_int: int) -> bytes:
+        return (hash_int & KEY_MASK).to_bytes(16, byteorder='big')
+    
+    def get(self, hash_int: int) -> Optional[str]:
+        key = self._key(hash_int)
+        name = self._entries.get(key)
+        if name is not None or self._spill is None:
+            return name
+        
+        row = self._spill.execute("SELECT name FROM names WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        self._store(key, row[0])
+        return row[0]
+    
+    def put(self, hash_int: int, name: str) -> None:
+        self._store(self._key(hash_int), name)
+    
+    def _store(self, key: bytes, name: str) -> None:
+        if self.max_entries is not None and len(self._entries) >= self.max_entries:
+            self._spill_entries()
+        self._entries[key] = name
+    
+    def _spill_entries(self) -> None:
+        if self._spill is None:
+            self._spill = sqlite3.connect('', check_same_thread=False)
+            self._spill.execute("CREATE TABLE names (key BLOB PRIMARY KEY, name TEXT NOT NULL) WITHOUT ROWID")
+        
+        self._spill.executemany("INSERT OR REPLACE INTO names (key, name) VALUES (?, ?)", self._entries.items())
+        self._spill.commit()
+        self._entries = {}
+        self.spills += 1
+    
+    def items(self) -> Iterator[Tuple[bytes, str]]:
+        if self._spill is not None:
+            yield from self._spill.execute("SELECT key, name FROM names")
+        yield from self._entries.items()
+    
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
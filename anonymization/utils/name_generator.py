@@ -1,59 +1,231 @@
-from typing import Dict
-from faker import Faker
-from faker.exceptions import UniquenessException
+import random
+from functools import cached_property
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+from anonymization.utils.mapping_table import MappingTable
+from anonymization.utils.name_cache import NameCache
+from anonymization.utils.name_pool import NamePool
+from anonymization.utils.pseudonym_vault import PseudonymVault
+
+
+DETERMINISTIC_SUFFIX_SPACE = 10_000
 
 
 class NameGenerator:
     
-    def __init__(self, locale: str = 'en_US', seed: int = None):
+    def __init__(self,
+                 locale: str = 'en_US',
+                 seed: int = None,
+                 deterministic: bool = False,
+                 suffix_space: int = DETERMINISTIC_SUFFIX_SPACE,
+                 vault: Optional[PseudonymVault] = None,
+                 cache_entries: Optional[int] = None):
         self.locale = locale
-        self.faker = Faker(self.locale)
-        if seed is not None:
-            self.faker.seed_instance(seed)
-        self.first_name_cache: Dict[int, str] = {}
-        self.last_name_cache: Dict[int, str] = {}
+        self.seed = seed
+        self.deterministic = deterministic
+        self.suffix_space = suffix_space
+        self.vault = vault
+        self.mapping: Optional[MappingTable] = None
+        self.mapping_reserved = False
+        self.unique_exhausted_first = False
+        self.unique_exhausted_last = False
+        self.first_name_cache = NameCache(cache_entries)
+        self.last_name_cache = NameCache(cache_entries)
         self.suffix_counter_first: Dict[str, int] = {}
         self.suffix_counter_last: Dict[str, int] = {}
+        self.stats: Dict[str, int] = {
+            'first_name_cache_hits': 0,
+            'first_name_cache_misses': 0,
+            'last_name_cache_hits': 0,
+            'last_name_cache_misses': 0,
+            'vault_hits': 0,
+            'mapping_hits': 0,
+            'faker_names': 0,
+            'faker_fallbacks': 0
+        }
+        self.reserved_first: Set[str] = vault.used_names('first_name') if vault else set()
+        self.reserved_last: Set[str] = vault.used_names('last_name') if vault else set()
+    
+    @cached_property
+    def faker(self) -> Any:
+        from faker import Faker
+        
+        faker = Faker(self.locale)
+        if self.seed is not None:
+            faker.seed_instance(self.seed)
+        return faker
+    
+    @cached_property
+    def pool(self) -> NamePool:
+        return NamePool.for_locale(self.locale)
+    
+    @cached_property
+    def first_name_table(self) -> Tuple[str, ...]:
+        return self._shuffle(self.pool.first_names, self.seed)
+    
+    @cached_property
+    def last_name_table(self) -> Tuple[str, ...]:
+        return self._shuffle(self.pool.last_names, self.seed)
+    
+    def _shuffle(self, names: Tuple[str, ...], seed: Optional[int]) -> Tuple[str, ...]:
+        shuffled = list(names)
+        random.Random(seed).shuffle(shuffled)
+        return tuple(shuffled)
+    
+    def _pick(self, table: Tuple[str, ...], hash_int: int) -> str:
+        base_name = table[hash_int % len(table)]
+        rank = (hash_int >> 128) % self.suffix_space
+        
+        if rank == 0:
+            return base_name
+        return f"{base_name}{rank + 1}"
     
     def get_first_name(self, hash_int: int) -> str:
-        if hash_int in self.first_name_cache:
-            return self.first_name_cache[hash_int]
-        
-        try:
-            name = self.faker.unique.first_name()
-        except UniquenessException:
-            temp_faker = Faker(self.locale)
-            temp_faker.seed_instance(hash_int)
-            base_name = temp_faker.first_name()
-            
-            if base_name not in self.suffix_counter_first:
-                self.suffix_counter_first[base_name] = 2
-            else:
-                self.suffix_counter_first[base_name] += 1
-            
-            name = f"{base_name}{self.suffix_counter_first[base_name]}"
+        name = self.first_name_cache.get(hash_int)
+        if name is not None:
+            self.stats['first_name_cache_hits'] += 1
+            return name
+        
+        self.stats['first_name_cache_misses'] += 1
+        name = self.mapping.get('first_name', hash_int) if self.mapping else None
+        
+        if name is not None:
+            self.stats['mapping_hits'] += 1
+        else:
+            name = self._lookup_or_generate_first_name(hash_int)
         
-        self.first_name_cache[hash_int] = name
+        self.first_name_cache.put(hash_int, name)
         return name
     
     def get_last_name(self, hash_int: int) -> str:
-        if hash_int in self.last_name_cache:
-            return self.last_name_cache[hash_int]
-        
-        try:
-            name = self.faker.unique.last_name()
-        except UniquenessException:
-            temp_faker = Faker(self.locale)
-            temp_faker.seed_instance(hash_int)
-            base_name = temp_faker.last_name()
+        name = self.last_name_cache.get(hash_int)
+        if name is not None:
+            self.stats['last_name_cache_hits'] += 1
+            return name
+        
+        self.stats['last_name_cache_misses'] += 1
+        name = self.mapping.get('last_name', hash_int) if self.mapping else None
+        
+        if name is not None:
+            self.stats['mapping_hits'] += 1
+        else:
+            name = self._lookup_or_generate_last_name(hash_int)
+        
+        self.last_name_cache.put(hash_int, name)
+        return name
+    
+    def use_mapping(self, mapping: MappingTable) -> None:
+        self.mapping = mapping
+        self.mapping_reserved = False
+    
+    def _reserve_mapped_names(self) -> None:
+        if self.mapping is not None and not self.mapping_reserved:
+            self.reserved_first.update(self.mapping.names('first_name'))
+            self.reserved_last.update(self.mapping.names('last_name'))
+            self.mapping_reserved = True
+    
+    def export_entries(self) -> Dict[str, Iterator[Tuple[bytes, str]]]:
+        return {
+            'first_name': self._export_kind('first_name', self.first_name_cache),
+            'last_name': self._export_kind('last_name', self.last_name_cache)
+        }
+    
+    def _export_kind(self, kind: str, cache: NameCache) -> Iterator[Tuple[bytes, str]]:
+        if self.mapping is not None:
+            yield from self.mapping.items(kind)
+        yield from cache.items()
+    
+    def _lookup_or_generate_first_name(self, hash_int: int) -> str:
+        name = self.vault.get('first_name', hash_int) if self.vault else None
+        
+        if name is not None:
+            self.stats['vault_hits'] += 1
+            return name
+        
+        if self.deterministic:
+            name = self._pick(self.first_name_table, hash_int)
+        else:
+            name = self._next_first_name(hash_int)
+        
+        if self.vault:
+            self.vault.put('first_name', hash_int, name)
+        return name
+    
+    def _next_first_name(self, hash_int: int) -> str:
+        from faker.exceptions import UniquenessException
+        
+        self._reserve_mapped_names()
+        name = None
+        if not self.unique_exhausted_first:
+            try:
+                name = self.faker.unique.first_name()
+                while name in self.reserved_first:
+                    name = self.faker.unique.first_name()
+                self.stats['faker_names'] += 1
+            except UniquenessException:
+                self.unique_exhausted_first = True
+                name = None
+        
+        if name is None:
+            self.stats['faker_fallbacks'] += 1
+            base_name = self.pool.first_names[hash_int % len(self.pool.first_names)]
             
-            if base_name not in self.suffix_counter_last:
-                self.suffix_counter_last[base_name] = 2
-            else:
-                self.suffix_counter_last[base_name] += 1
+            name = base_name
+            while name in self.reserved_first or name == base_name:
+                if base_name not in self.suffix_counter_first:
+                    self.suffix_counter_first[base_name] = 2
+                else:
+                    self.suffix_counter_first[base_name] += 1
+                
+                name = f"{base_name}{self.suffix_counter_first[base_name]}"
+        
+        return name
+    
+    def _lookup_or_generate_last_name(self, hash_int: int) -> str:
+        name = self.vault.get('last_name', hash_int) if self.vault else None
+        
+        if name is not None:
+            self.stats['vault_hits'] += 1
+            return name
+        
+        if self.deterministic:
+            name = self._pick(self.last_name_table, hash_int)
+        else:
+            name = self._next_last_name(hash_int)
+        
+        if self.vault:
+            self.vault.put('last_name', hash_int, name)
+        return name
+    
+    def _next_last_name(self, hash_int: int) -> str:
+        from faker.exceptions import UniquenessException
+        
+        self._reserve_mapped_names()
+        name = None
+        if not self.unique_exhausted_last:
+            try:
+                name = self.faker.unique.last_name()
+                while name in self.reserved_last:
+                    name = self.faker.unique.last_name()
+                self.stats['faker_names'] += 1
+            except UniquenessException:
+                self.unique_exhausted_last = True
+                name = None
+        
+        if name is None:
+            self.stats['faker_fallbacks'] += 1
+            base_name = self.pool.last_names[hash_int % len(self.pool.last_names)]
             
-            name = f"{base_name}{self.suffix_counter_last[base_name]}"
+            name = base_name
+            while name in self.reserved_last or name == base_name:
+                if base_name not in self.suffix_counter_last:
+                    self.suffix_counter_last[base_name] = 2
+                else:
+                    self.suffix_counter_last[base_name] += 1
+                
+                name = f"{base_name}{self.suffix_counter_last[base_name]}"
         
-        self.last_name_cache[hash_int] = name
         return name
-
+    
+    def close(self) -> None:
+        self.first_name_cache.close()
+        self.last_name_cache.close()
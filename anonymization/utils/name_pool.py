@@ -0,0 +1,32 @@
+from typing import Any, Dict, Tuple
+
+
+class NamePool:
+    
+    _pools: Dict[str, 'NamePool'] = {}
+    
+    def __init__(self, locale: str = 'en_US'):
+        from faker import Faker
+        
+        self.locale = locale
+        faker = Faker(locale)
+        self.first_names = self._load(faker, 'first_names')
+        self.last_names = self._load(faker, 'last_names')
+    
+    @classmethod
+    def for_locale(cls, locale: str) -> 'NamePool':
+        if locale not in cls._pools:
+            cls._pools[locale] = cls(locale)
+        return cls._pools[locale]
+    
+    def _load(self, faker: Any, attribute: str) -> Tuple[str, ...]:
+        variants = [attribute, f"{attribute}_female", f"{attribute}_male"]
+        
+        for provider in faker.get_providers():
+            names = set()
+            for variant in variants:
+                names.update(getattr(provider, variant, ()))
+            if names:
+                return tuple(sorted(names))
+        
+        raise ValueError(f"Locale {self.locale} has no {attribute}")
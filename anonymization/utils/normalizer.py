@@ -1,6 +1,11 @@
 import unicodedata
-from typing import Any
+from typing import Any, Callable, List, Sequence
+import numpy as np
 import pandas as pd
+from anonymization.utils.dependencies import import_pyarrow
+
+
+ASCII_WHITESPACE = ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
 
 
 class StringNormalizer:
@@ -16,6 +21,9 @@ class StringNormalizer:
         text = text.casefold()
         
         return text
+    
+    def normalize_many(self, values: Sequence[Any]) -> List[str]:
+        return [self.normalize(value) for value in values]
 
 
 class IdNormalizer:
@@ -26,4 +34,42 @@ class IdNormalizer:
             return ""
         
         return str(value).strip()
+    
+    def normalize_many(self, values: Sequence[Any]) -> List[str]:
+        return [self.normalize(value) for value in values]
+
+
+def _normalize_with_arrow(values: Sequence[Any], lowercase: bool, fallback: Callable[[Any], str]) -> List[str]:
+    pa, _ = import_pyarrow()
+    import pyarrow.compute as pc
+    
+    try:
+        array = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return [fallback(value) for value in values]
+    
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return [fallback(value) for value in values]
+    
+    normalized = pc.utf8_trim(array, characters=ASCII_WHITESPACE)
+    if lowercase:
+        normalized = pc.ascii_lower(normalized)
+    result = normalized.fill_null("").to_pylist()
+    
+    non_ascii = pc.invert(pc.string_is_ascii(array).fill_null(True))
+    for index in np.flatnonzero(non_ascii.to_numpy(zero_copy_only=False)):
+        result[index] = fallback(values[index])
+    
+    return result
+
 
+class ArrowStringNormalizer(StringNormalizer):
+    
+    def normalize_many(self, values: Sequence[Any]) -> List[str]:
+        return _normalize_with_arrow(values, True, self.normalize)
+
+
+class ArrowIdNormalizer(IdNormalizer):
+    
+    def normalize_many(self, values: Sequence[Any]) -> List[str]:
+        return _normalize_with_arrow(values, False, self.normalize)
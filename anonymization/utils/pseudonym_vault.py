@@ -0,0 +1,67 @@
+import hashlib
+import sqlite3
+from typing import List, Optional, Set, Tuple
+
+
+class PseudonymVault:
+    
+    def __init__(self, path: str, fingerprint: str, batch_size: int = 10_000):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS pseudonyms ("
+            "fingerprint TEXT NOT NULL, "
+            "kind TEXT NOT NULL, "
+            "digest BLOB NOT NULL, "
+            "pseudonym TEXT NOT NULL, "
+            "PRIMARY KEY (fingerprint, kind, digest)"
+            ") WITHOUT ROWID"
+        )
+        self.connection.commit()
+        self._pending: List[Tuple[str, str, bytes, str]] = []
+    
+    @staticmethod
+    def fingerprint_for(salt: bytes, locale: str, deterministic: bool) -> str:
+        mode = 'deterministic' if deterministic else 'sequential'
+        material = b'namechameleon-vault\0' + salt + f"\0{locale}\0{mode}".encode('utf-8')
+        return hashlib.sha256(material).hexdigest()[:32]
+    
+    @staticmethod
+    def _digest(hash_int: int) -> bytes:
+        return hash_int.to_bytes(32, byteorder='big')
+    
+    def get(self, kind: str, hash_int: int) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT pseudonym FROM pseudonyms WHERE fingerprint = ? AND kind = ? AND digest = ?",
+            (self.fingerprint, kind, self._digest(hash_int))
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, kind: str, hash_int: int, pseudonym: str) -> None:
+        self._pending.append((self.fingerprint, kind, self._digest(hash_int), pseudonym))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def used_names(self, kind: str) -> Set[str]:
+        rows = self.connection.execute(
+            "SELECT pseudonym FROM pseudonyms WHERE fingerprint = ? AND kind = ?",
+            (self.fingerprint, kind)
+        )
+        return {row[0] for row in rows}
+    
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO pseudonyms (fingerprint, kind, digest, pseudonym) VALUES (?, ?, ?, ?)",
+            self._pending
+        )
+        self.connection.commit()
+        self._pending = []
+    
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
+import numpy as np
 import pandas as pd
 from anonymization import (
     Anonymizer,
@@ -28,6 +29,28 @@ class EmployeeIdHandler(BaseColumnHandler):
         
         # Return in EID-XXXX format
         return f"EID-{digits}"
+    
+    def anonymize_batch(self, values: Sequence[Any]) -> List[str]:
+        # Normalize the whole column at once
+        normalized = self.normalizer.normalize_many(values)
+        present = [i for i, text in enumerate(normalized) if text]
+        result = [""] * len(normalized)
+        if not present:
+            return result
+        
+        # Hash every value into 256-bit digests (four 64-bit words each)
+        words = self.hasher.hash_many([normalized[i] for i in present], bits=256)
+        
+        # Reduce the digests modulo 10000 word by word, same as hash_int % 10000
+        modulus = np.uint64(10000)
+        word_factor = np.uint64(2 ** 64 % 10000)
+        remainder = np.zeros(len(present), dtype=np.uint64)
+        for column in range(words.shape[1]):
+            remainder = (remainder * word_factor + words[:, column] % modulus) % modulus
+        
+        for i, number in zip(present, remainder.tolist()):
+            result[i] = f"EID-{number:04d}"
+        return result
 
 
 # Extend Anonymizer to support custom handlers
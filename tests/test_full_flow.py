@@ -1,9 +1,11 @@
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pandas as pd
 from anonymization.core.anonymizer import Anonymizer
+from anonymization.cli.file_handlers import CsvFileHandler, ExcelFileHandler, get_file_handler
 
 print("=" * 80)
 print("Creating Test Data")
@@ -129,6 +131,175 @@ if not all_match:
         if not df1[col].equals(df2[col]):
             print(f"  Column '{col}' differs")
 
+print("\n" + "=" * 80)
+print("Testing Chunked CSV Matches Whole-File Run")
+print("=" * 80)
+
+anonymizer3 = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+anonymizer3.anonymize_csv('test_input.csv', 'test_output_chunked.csv', chunksize=3)
+
+df3 = pd.read_csv('test_output_chunked.csv')
+print(f"✓ Chunked output identical: {df1.equals(df3)}")
+
+anonymizer4 = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+anonymizer4.anonymize_excel('test_input.xlsx', 'test_output_chunked.xlsx', chunksize=3)
+
+for sheet_name in ['Employees', 'Summary']:
+    whole = pd.read_excel('test_output.xlsx', sheet_name=sheet_name)
+    streamed = pd.read_excel('test_output_chunked.xlsx', sheet_name=sheet_name)
+    print(f"✓ Streamed Excel sheet '{sheet_name}' identical: {whole.equals(streamed)}")
+
+print("\n" + "=" * 80)
+print("Testing Raw Passthrough of Unconfigured CSV Columns")
+print("=" * 80)
+
+raw_df = df.assign(Code=['007', '010', '2.50', '1e3'], Status=['NA', 'null', '', 'ok'])
+raw_df.to_csv('test_input_raw.csv', index=False)
+
+anonymizer5 = Anonymizer(column_config=column_config, salt=salt, locale='en_US', passthrough=True)
+anonymizer5.anonymize_csv('test_input_raw.csv', 'test_output_raw.csv')
+
+raw_output = pd.read_csv('test_output_raw.csv', dtype=str, keep_default_na=False)
+print(f"✓ Codes kept as raw text: {list(raw_output['Code']) == ['007', '010', '2.50', '1e3']}")
+print(f"✓ NA-like text kept: {list(raw_output['Status']) == ['NA', 'null', '', 'ok']}")
+print(f"✓ Configured columns unchanged: {raw_output[list(column_config)].equals(pd.read_csv('test_output.csv', dtype=str, keep_default_na=False)[list(column_config)])}")
+
+print("\n" + "=" * 80)
+print("Testing Header-Only Column Detection")
+print("=" * 80)
+
+excel_handler = ExcelFileHandler('test_input.xlsx')
+pandas_headers = {name: sheet.columns.tolist() for name, sheet in pd.read_excel('test_input.xlsx', sheet_name=None, nrows=0).items()}
+print(f"✓ Excel sheet headers match pandas: {excel_handler.sheet_columns() == pandas_headers}")
+print(f"✓ CSV header matches pandas: {CsvFileHandler('test_input.csv').detect_columns() == pd.read_csv('test_input.csv', nrows=0).columns.tolist()}")
+
+with pd.ExcelWriter('test_input_blank_headers.xlsx', engine='openpyxl') as writer:
+    pd.DataFrame([['x', None, 1.0, 'x', 2.5, None, None], [1, 2, 3, 4, 5, 6, 7]]).to_excel(writer, index=False, header=False)
+blank_headers = pd.read_excel('test_input_blank_headers.xlsx').columns.tolist()
+print(f"✓ Blank trailing headers above data kept: {ExcelFileHandler('test_input_blank_headers.xlsx').detect_columns() == blank_headers}")
+
+print("\n" + "=" * 80)
+print("Testing DataFrame Output Modes")
+print("=" * 80)
+
+frame = pd.read_csv('test_input.csv')
+original = frame.copy()
+expected = Anonymizer(column_config=column_config, salt=salt, locale='en_US').anonymize_dataframe(frame)
+print(f"✓ Input frame untouched: {frame.equals(original)}")
+
+columns_only = Anonymizer(column_config=column_config, salt=salt, locale='en_US').anonymize_dataframe(frame, columns_only=True)
+configured = [col for col in frame.columns if col in column_config]
+print(f"✓ Columns-only output: {columns_only.equals(expected[configured])}")
+
+in_place_result = Anonymizer(column_config=column_config, salt=salt, locale='en_US').anonymize_dataframe(frame, inplace=True)
+print(f"✓ In-place output: {in_place_result is None and frame.equals(expected)}")
+
+mixed = pd.DataFrame({'EmployeeID': pd.Series([1, 1.0, True, '1', 0, False, 0.0], dtype=object)})
+mixed_anonymizer = Anonymizer(column_config={'EmployeeID': 'id'}, salt=salt)
+mixed_ids = mixed_anonymizer.anonymize_dataframe(mixed)['EmployeeID'].tolist()
+per_cell_ids = [mixed_anonymizer.handlers['EmployeeID'].anonymize(value) for value in mixed['EmployeeID']]
+print(f"✓ Mixed-type object column keeps types apart: {mixed_ids == per_cell_ids}")
+
+print("\n" + "=" * 80)
+print("Testing Mapping Export and Reload")
+print("=" * 80)
+
+exporter = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+exporter.anonymize_csv('test_input.csv', 'test_output_mapped.csv')
+exporter.export_mapping('test_mapping.ncmap')
+
+reloaded = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+reloaded.load_mapping('test_mapping.ncmap')
+pd.read_csv('test_input.csv').iloc[::-1].to_csv('test_input_reversed.csv', index=False)
+reloaded.anonymize_csv('test_input_reversed.csv', 'test_output_reversed.csv')
+reversed_output = pd.read_csv('test_output_reversed.csv').iloc[::-1].reset_index(drop=True)
+print(f"✓ Reloaded mapping ignores row order: {reversed_output.equals(pd.read_csv('test_output_mapped.csv'))}")
+print(f"✓ No new names generated: {reloaded.name_generator.stats['faker_names'] == 0}")
+reloaded.close()
+
+incremental = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+incremental.load_mapping('test_mapping.ncmap')
+incremental.anonymize_dataframe(pd.read_csv('test_input.csv').head(1))
+incremental.export_mapping('test_mapping.ncmap')
+incremental.close()
+
+re_exported = Anonymizer(column_config=column_config, salt=salt, locale='en_US')
+re_exported.load_mapping('test_mapping.ncmap')
+re_exported.anonymize_csv('test_input.csv', 'test_output_reexported.csv')
+print(f"✓ Re-export keeps the loaded mapping: {pd.read_csv('test_output_reexported.csv').equals(pd.read_csv('test_output_mapped.csv'))}")
+print(f"✓ Nothing regenerated after re-export: {re_exported.name_generator.stats['faker_names'] == 0}")
+re_exported.close()
+
+print("\n" + "=" * 80)
+print("Testing Parquet and Feather Round Trip")
+print("=" * 80)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    
+    arrow_frame = pd.read_csv('test_input.csv').assign(
+        Badge=pd.array([17, None, 42, 17], dtype='Int64'),
+        Age=[34, 28, 45, 51],
+        Joined=pd.to_datetime(['2020-01-01', '2021-06-15', '2019-03-10', '2022-11-30'])
+    )
+    arrow_config = {**column_config, 'Badge': 'id'}
+    arrow_table = pa.Table.from_pandas(arrow_frame, preserve_index=False)
+    expected = Anonymizer(column_config=arrow_config, salt=salt, locale='en_US').anonymize_dataframe(arrow_frame)
+    configured = list(arrow_config)
+    untouched = [name for name in arrow_table.column_names if name not in arrow_config]
+    
+    for label, suffix, write_table, read_table, read_frame in (
+        ('Parquet', 'parquet', pq.write_table, pq.read_table, pd.read_parquet),
+        ('Feather', 'feather', feather.write_feather, feather.read_table, pd.read_feather)
+    ):
+        write_table(arrow_table, f'test_input.{suffix}')
+        file_handler = get_file_handler(f'test_input.{suffix}')
+        file_handler.anonymize(Anonymizer(column_config=arrow_config, salt=salt, locale='en_US'), f'test_output.{suffix}')
+        output_table = read_table(f'test_output.{suffix}')
+        
+        print(f"✓ {label} columns detected: {file_handler.detect_columns() == arrow_table.column_names}")
+        output_frame = read_frame(f'test_output.{suffix}')
+        print(f"✓ {label} configured columns match anonymize_dataframe: {output_frame[configured].astype(object).equals(expected[configured].astype(object))}")
+        print(f"✓ {label} untouched columns read back through pandas: {output_frame[untouched].equals(arrow_frame[untouched])}")
+        print(f"✓ {label} untouched columns keep Arrow types: {all(output_table.schema.field(name).type == arrow_table.schema.field(name).type for name in untouched)}")
+except ImportError:
+    print("pyarrow not installed, skipping")
+
+print("\n" + "=" * 80)
+print("Testing Pseudonym Vault Across Runs")
+print("=" * 80)
+
+vault_path = os.path.join(tempfile.mkdtemp(), 'pseudonyms.db')
+first_run = Anonymizer(column_config=column_config, salt=salt, locale='en_US', vault_path=vault_path)
+first_run.anonymize_csv('test_input.csv', 'test_output_vault1.csv')
+first_run.close()
+
+new_rows = pd.DataFrame({
+    'FirstName': ['Peter', 'Olivia'],
+    'LastName': ['Parker', 'Stone'],
+    'FullName': ['Peter Parker', 'Olivia Stone'],
+    'Email': ['peter.parker@company.com', 'olivia.stone@example.org'],
+    'EmployeeID': ['EMP005', 'EMP006'],
+    'Department': ['Sales', 'Legal'],
+    'Notes': ['New 5', 'New 6']
+})
+pd.concat([pd.read_csv('test_input.csv').iloc[::-1], new_rows]).to_csv('test_input_vault2.csv', index=False)
+
+second_run = Anonymizer(column_config=column_config, salt=salt, locale='en_US', vault_path=vault_path)
+second_run.anonymize_csv('test_input_vault2.csv', 'test_output_vault2.csv')
+second_run.close()
+
+first_output = pd.read_csv('test_output_vault1.csv')
+second_output = pd.read_csv('test_output_vault2.csv')
+old_rows = second_output.iloc[:len(first_output)].iloc[::-1].reset_index(drop=True)
+added_rows = second_output.iloc[len(first_output):]
+print(f"✓ Old values keep their pseudonyms: {old_rows.equals(first_output)}")
+print(f"✓ New first names avoid reserved ones: {not added_rows['FirstName'].isin(first_output['FirstName']).any()}")
+print(f"✓ New last names avoid reserved ones: {not added_rows['LastName'].isin(first_output['LastName']).any()}")
+print(f"✓ Vault reused stored names: {second_run.name_generator.stats['vault_hits'] > 0}")
+
 print("\n" + "=" * 80)
 print("All tests completed!")
 print("=" * 80)
@@ -1,14 +1,18 @@
 import sys
 import os
+import pandas as pd
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from anonymization.utils.normalizer import StringNormalizer
 from anonymization.utils.hasher import DeterministicHasher
 from anonymization.utils.name_generator import NameGenerator
+from anonymization.core.anonymizer import Anonymizer
 from anonymization.core.column_handlers import (
+    BaseColumnHandler,
     FirstNameHandler,
     LastNameHandler,
     FullNameHandler,
+    FullNameInvertedHandler,
     EmailHandler,
     IdHandler,
     MiscHandler
@@ -111,3 +115,107 @@ print(f"Input: {test_name}")
 print(f"Results: {results}")
 print(f"✓ All identical: {len(set(results)) == 1}")
 
+
+print("\n" + "=" * 80)
+print("Testing Vectorized ID Encoding")
+print("=" * 80)
+
+ids = ["EMP001", "EMP002", None, "", "  EMP001 ", 12345]
+print(f"✓ Batch matches per-cell: {id_handler.prepare_many(ids) == [id_handler.anonymize(value) for value in ids]}")
+
+long_id_handler = IdHandler(hasher, normalizer, length=20, alphabet="0123456789abcdef")
+long_ids = long_id_handler.prepare_many(ids)
+print(f"Hex IDs: {long_ids[:2]}")
+print(f"✓ Custom alphabet matches per-cell: {long_ids == [long_id_handler.anonymize(value) for value in ids]}")
+
+for label, options in [("empty ID length", {'length': 0}), ("one-character alphabet", {'alphabet': "a"})]:
+    try:
+        IdHandler(hasher, normalizer, **options)
+        print(f"✓ Rejected {label}: False")
+    except ValueError as error:
+        print(f"✓ Rejected {label}: True ({error})")
+
+
+print("\n" + "=" * 80)
+print("Testing Token-Level Name Batching")
+print("=" * 80)
+
+names = ["John Smith", "Mary Ann Smith", "john", None, "", "  Alice  Johnson ", "Mary Ann Smith"]
+emails = ["john.smith@company.com", "alice@company.com", "invalid", "@company.com", None, "Mary.Jane.Doe@corp.org"]
+
+for handler_class, values in [(FullNameHandler, names), (FullNameInvertedHandler, names), (EmailHandler, emails)]:
+    batch_handler = handler_class(hasher, normalizer, NameGenerator(locale='en_US', seed=7))
+    cell_handler = handler_class(hasher, normalizer, NameGenerator(locale='en_US', seed=7))
+    batch = batch_handler.render_many(batch_handler.prepare_many(values))
+    print(f"{handler_class.__name__}: {batch[:2]}")
+    print(f"✓ Batch matches per-cell: {batch == [cell_handler.anonymize(value) for value in values]}")
+
+
+print("\n" + "=" * 80)
+print("Testing Batch Handler Protocol")
+print("=" * 80)
+
+
+class UpperHandler(BaseColumnHandler):
+    
+    def anonymize(self, value):
+        return str(value).upper()
+
+
+class BatchUpperHandler(UpperHandler):
+    
+    def __init__(self, hasher, normalizer):
+        super().__init__(hasher, normalizer)
+        self.batch_sizes = []
+    
+    def anonymize_batch(self, values):
+        self.batch_sizes.append(len(values))
+        return pd.Series(values, dtype=object).str.upper().tolist()
+
+
+class BatchAnonymizer(Anonymizer):
+    
+    def get_handlers(self):
+        handlers = super().get_handlers()
+        handlers['upper'] = BatchUpperHandler(self.hasher, normalizer)
+        return handlers
+
+
+codes = ["ab", "cd", "ab", "ef"]
+print(f"✓ Default batch falls back to anonymize: {UpperHandler(hasher, normalizer).anonymize_batch(codes) == ['AB', 'CD', 'AB', 'EF']}")
+print(f"✓ Built-in batch matches per-cell: {full_handler.anonymize_batch(names) == [full_handler.anonymize(value) for value in names]}")
+
+batch_anonymizer = BatchAnonymizer({'Code': 'upper'})
+batch_df = batch_anonymizer.anonymize_dataframe(pd.DataFrame({'Code': codes}))
+batch_handler = batch_anonymizer.handlers['Code']
+print(f"Batches: {batch_handler.batch_sizes}")
+print(f"✓ Anonymizer uses batch override on distinct values: {batch_df['Code'].tolist() == ['AB', 'CD', 'AB', 'EF'] and batch_handler.batch_sizes == [3]}")
+
+
+class ShoutingFirstNameHandler(FirstNameHandler):
+    
+    def anonymize(self, value):
+        return super().anonymize(value).upper()
+
+
+class PrefixedIdHandler(IdHandler):
+    
+    def anonymize(self, value):
+        return f"ID-{super().anonymize(value)}"
+
+
+class OverridingAnonymizer(Anonymizer):
+    
+    def get_handlers(self):
+        handlers = super().get_handlers()
+        handlers['first_name'] = ShoutingFirstNameHandler(self.hasher, normalizer, self.name_generator)
+        handlers['id'] = PrefixedIdHandler(self.hasher, handlers['id'].normalizer)
+        return handlers
+
+
+overriding_anonymizer = OverridingAnonymizer({'First': 'first_name', 'Code': 'id'}, locale='en_US')
+overriding_df = overriding_anonymizer.anonymize_dataframe(pd.DataFrame({'First': ['John', 'Alice', 'John'], 'Code': ['E1', 'E2', 'E1']}))
+print(overriding_df.to_string(index=False))
+print(f"✓ Overridden anonymize used for names: {all(name.isupper() for name in overriding_df['First'])}")
+print(f"✓ Overridden anonymize used for IDs: {all(code.startswith('ID-') for code in overriding_df['Code'])}")
+print(f"✓ Built-in handlers keep the staged path: {not any(handler.overrides_anonymize() for handler in (first_handler, full_handler, email_handler, id_handler, misc_handler))}")
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+import pandas as pd
+from anonymization.core.anonymizer import Anonymizer
+from anonymization.service.server import AnonymizationServer, RequestError
+
+print("=" * 80)
+print("Starting Anonymization Service")
+print("=" * 80)
+
+data_dir = tempfile.mkdtemp()
+server = AnonymizationServer(port=0, concurrency=2, data_dir=data_dir)
+loop = asyncio.new_event_loop()
+loop.run_until_complete(server.start())
+thread = threading.Thread(target=loop.run_forever, daemon=True)
+thread.start()
+print(f"✓ Listening on {server.address}")
+
+
+def post(body: dict) -> tuple:
+    request = urllib.request.Request(f"{server.address}/anonymize", data=json.dumps(body).encode('utf-8'), method='POST')
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+salt = bytes(range(32))
+column_config = {'FirstName': 'first_name', 'Email': 'email', 'EmployeeID': 'id'}
+rows = [
+    {'FirstName': 'John', 'Email': 'john.smith@company.com', 'EmployeeID': 'EMP001', 'Code': '007'},
+    {'FirstName': 'Alice', 'Email': 'alice.johnson@company.com', 'EmployeeID': 'EMP002', 'Code': '010'}
+]
+
+print("\n" + "=" * 80)
+print("Testing Row Batches")
+print("=" * 80)
+
+status, first = post({'salt': salt.hex(), 'columns': column_config, 'rows': rows})
+status2, second = post({'salt': salt.hex(), 'columns': column_config, 'rows': rows})
+
+expected = Anonymizer(column_config, salt=salt).anonymize_dataframe(pd.DataFrame(rows))
+print(f"Response: {first}")
+print(f"✓ Status 200: {status == 200 and status2 == 200}")
+print(f"✓ Matches Anonymizer output: {first['rows'] == expected.to_dict('records')}")
+print(f"✓ Warm anonymizer reused: {first == second and len(server.registry) == 1}")
+
+print("\n" + "=" * 80)
+print("Testing Invalid Requests")
+print("=" * 80)
+
+status, error = post({'columns': column_config, 'rows': rows})
+print(f"✓ Missing salt rejected: {status == 400} ({error['error']})")
+status, error = post({'salt': salt.hex(), 'columns': {'FirstName': 'unknown'}, 'rows': rows})
+print(f"✓ Unknown column type rejected: {status == 400} ({error['error']})")
+
+print("\n" + "=" * 80)
+print("Testing File Requests")
+print("=" * 80)
+
+pd.DataFrame(rows).to_csv(os.path.join(data_dir, 'in.csv'), index=False)
+file_request = {'salt': salt.hex(), 'columns': column_config}
+status, result = post({**file_request, 'input_path': 'in.csv', 'output_path': 'out.csv'})
+print(f"✓ File inside data directory anonymized: {status == 200 and os.path.exists(os.path.join(data_dir, 'out.csv'))}")
+status, error = post({**file_request, 'input_path': 'in.csv', 'output_path': '../escaped.csv'})
+print(f"✓ Output outside data directory rejected: {status == 403} ({error['error']})")
+status, error = post({**file_request, 'input_path': '/etc/hostname', 'output_path': 'out2.csv'})
+print(f"✓ Absolute input outside data directory rejected: {status == 403} ({error['error']})")
+status, error = post({**file_request, 'input_path': 'in.csv', 'output_path': './in.csv'})
+print(f"✓ Output equal to input rejected: {status == 400} ({error['error']})")
+try:
+    AnonymizationServer()._resolve_data_path('in.csv')
+    print("✓ File requests disabled without a data directory: False")
+except RequestError as error:
+    print(f"✓ File requests disabled without a data directory: {error.status == 403} ({error})")
+
+asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+loop.call_soon_threadsafe(loop.stop)
+thread.join()
@@ -1,10 +1,13 @@
 import sys
 import os
+import pickle
+import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from anonymization.utils.normalizer import StringNormalizer
+from anonymization.utils.normalizer import StringNormalizer, ArrowStringNormalizer
 from anonymization.utils.hasher import DeterministicHasher
 from anonymization.utils.name_generator import NameGenerator
+from anonymization.utils.mapping_table import MappingTable
 
 test_data = [
     "John",
@@ -86,3 +89,109 @@ print(f"\nUnique pseudonyms: {len(set(pseudonyms))} / {len(pseudonyms)}")
 all_unique = len(set(pseudonyms)) == len(pseudonyms)
 print(f"✓ All unique test passed: {all_unique}")
 
+
+print("\n" + "=" * 80)
+print("Testing Order-Independent (Deterministic) Names")
+print("=" * 80)
+
+forward_gen = NameGenerator(locale='en_US', seed=42, deterministic=True)
+reverse_gen = NameGenerator(locale='en_US', seed=42, deterministic=True)
+
+hashes = [hasher.hash_to_int(normalizer.normalize(name)) for name in different_names]
+forward = [forward_gen.get_first_name(h) for h in hashes]
+reverse = [reverse_gen.get_first_name(h) for h in reversed(hashes)][::-1]
+
+for name, pseudo in zip(different_names, forward):
+    print(f"{name:15} → {pseudo}")
+
+print(f"\n✓ Same names regardless of order: {forward == reverse}")
+print(f"✓ All unique: {len(set(forward)) == len(forward)}")
+
+for locale in ('en_US', 'fi_FI'):
+    unique_gen = NameGenerator(locale=locale, seed=42, deterministic=True)
+    many_names = [unique_gen.get_first_name(hasher.hash_to_int(f"person-{i}")) for i in range(40_000)]
+    collision_bound = len(many_names) ** 2 / (2 * len(unique_gen.first_name_table) * unique_gen.suffix_space)
+    print(f"✓ 40,000 {locale} names collide within the documented bound: {len(many_names) - len(set(many_names)) < 2 * collision_bound}")
+    print(f"✓ Suffixes stay short: {all(len(name) - len(name.rstrip('0123456789')) <= 5 for name in many_names)}")
+
+
+print("\n" + "=" * 80)
+print("Testing Arrow Bulk Normalization")
+print("=" * 80)
+
+try:
+    arrow_normalized = ArrowStringNormalizer().normalize_many(test_data + ["ﬁona", "\u00a0Åsa "])
+    python_normalized = normalizer.normalize_many(test_data + ["ﬁona", "\u00a0Åsa "])
+    print(f"✓ Arrow matches Python normalization: {arrow_normalized == python_normalized}")
+except ImportError:
+    print("pyarrow not installed, skipping")
+
+
+print("\n" + "=" * 80)
+print("Testing Shared Hash Cache")
+print("=" * 80)
+
+cached_hasher = DeterministicHasher(salt=hasher.get_salt(), cache_size=2)
+uncached_hasher = DeterministicHasher(salt=hasher.get_salt(), cache_size=0)
+
+tokens = ["smith", "john", "smith", "mary", "john", "smith"]
+cached = [cached_hasher.hash_to_int(token) for token in tokens]
+uncached = [uncached_hasher.hash_to_int(token) for token in tokens]
+
+print(f"Cache stats: {cached_hasher.stats}")
+print(f"✓ Cached hashes identical: {cached == uncached}")
+print(f"✓ Least recently used tokens evicted: {cached_hasher.stats == {'hash_cache_hits': 1, 'hash_cache_misses': 5}}")
+
+restored_hasher = pickle.loads(pickle.dumps(cached_hasher))
+print(f"✓ Pickled hasher gives the same hashes: {[restored_hasher.hash_to_int(token) for token in tokens] == uncached}")
+
+
+print("\n" + "=" * 80)
+print("Testing Bounded Name Cache")
+print("=" * 80)
+
+bounded_gen = NameGenerator(locale='en_US', seed=42, cache_entries=2)
+unbounded_gen = NameGenerator(locale='en_US', seed=42)
+
+repeated_hashes = hashes + hashes[::-1] + hashes
+bounded = [bounded_gen.get_first_name(h) for h in repeated_hashes]
+unbounded = [unbounded_gen.get_first_name(h) for h in repeated_hashes]
+
+print(f"Spills to disk: {bounded_gen.first_name_cache.spills}")
+print(f"✓ Same names with bounded cache: {bounded == unbounded}")
+print(f"✓ Consistent within run: {bounded[:len(hashes)] == bounded[-len(hashes):]}")
+bounded_gen.close()
+
+
+print("\n" + "=" * 80)
+print("Testing Mapping Table")
+print("=" * 80)
+
+mapping_path = os.path.join(tempfile.mkdtemp(), 'names.ncmap')
+first_names = {h: unbounded_gen.get_first_name(h) for h in hashes}
+first_names[7 << 64] = "Zoë"
+MappingTable.write(mapping_path, bytes(16), {
+    'first_name': ((h.to_bytes(32, byteorder='big')[16:], name) for h, name in first_names.items()),
+    'last_name': []
+})
+
+with MappingTable(mapping_path) as table:
+    print(f"Entries: {len(table)}, file size: {os.path.getsize(mapping_path)} bytes")
+    print(f"✓ All names found: {all(table.get('first_name', h) == name for h, name in first_names.items())}")
+    print(f"✓ Unknown digest missing: {table.get('first_name', 12345) is None and table.get('last_name', hashes[0]) is None}")
+    print(f"✓ Names listed: {sorted(table.names('first_name')) == sorted(first_names.values())}")
+
+reloaded_gen = NameGenerator(locale='en_US', seed=1)
+reloaded_gen.use_mapping(MappingTable(mapping_path))
+print(f"✓ Generator reuses mapped names: {[reloaded_gen.get_first_name(h) for h in hashes] == [first_names[h] for h in hashes]}")
+print(f"✓ No names generated: {reloaded_gen.stats['faker_names'] == 0 and reloaded_gen.stats['mapping_hits'] == len(set(hashes))}")
+print(f"✓ Mapped names not loaded before a miss: {not reloaded_gen.reserved_first}")
+new_name = reloaded_gen.get_first_name(hasher.hash_to_int("someone new"))
+print(f"✓ New name avoids mapped names: {new_name not in first_names.values() and set(first_names.values()) <= reloaded_gen.reserved_first}")
+reloaded_gen.mapping.close()
+
+deterministic_gen = NameGenerator(locale='en_US', seed=1, deterministic=True)
+deterministic_gen.use_mapping(MappingTable(mapping_path))
+deterministic_gen.get_first_name(hasher.hash_to_int("someone new"))
+print(f"✓ Deterministic names never load mapped names: {not deterministic_gen.reserved_first}")
+deterministic_gen.mapping.close()